@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the publish pipeline on synthetic catalogs.
+
+For each catalog size a synthetic catalog (see synthetic_catalog.py) is
+written to a scratch directory, then every step is timed:
+
+    parse    parse_sections + parse_metadata + build_description, all episodes
+    load     load_catalog() of episode_metadata.json
+    rss      generate_rss() → feed.xml (audio probe cache warm)
+    validate validate_feed.validate() of that feed.xml
+    season   season2.render_page() + write for the season 2 half
+    upload   upload.upload_audio() of up to --upload-limit audio files to a
+             local stand-in
+
+Each step runs --runs times and the fastest run is reported (the least
+disturbed by other load on the machine). Results are compared with
+benchmarks/baselines.json. A step is flagged as a regression, and the script
+exits non-zero, when it is slower than its baseline by more than
+--threshold and by more than its noise: NOISE_FACTOR times the spread
+between its fastest and median run (at least MIN_DELTA_MS), so a step whose
+runs vary a lot needs a bigger slowdown to count.
+
+Baselines only mean something on the machine that recorded them, so
+baselines.json is not committed: record one with --update-baseline before
+a change and compare after it.
+
+The upload step runs the real upload_audio() with internetarchive.get_item
+returning a stand-in item, whose upload() PUTs the file to a local server
+over a kept-alive connection. The archive.org round trips are left out.
+
+Usage:
+    python benchmarks/pipeline.py [--sizes 10,1000,50000] [--runs 5] [--threshold 0.25]
+    python benchmarks/pipeline.py --update-baseline
+"""
+
+import argparse
+import contextlib
+import http.client
+import http.server
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import types
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.synthetic_catalog import generate_catalog  # noqa: E402
+from compbio_podcast import audio_info  # noqa: E402
+from compbio_podcast.episodes import load_catalog  # noqa: E402
+from compbio_podcast.parse_episode import parse_metadata, parse_sections  # noqa: E402
+from compbio_podcast.rss import generate_rss  # noqa: E402
+from compbio_podcast.season2 import render_page  # noqa: E402
+from compbio_podcast.upload import upload_audio  # noqa: E402
+from compbio_podcast.show_notes import build_description  # noqa: E402
+from compbio_podcast.validate_feed import validate  # noqa: E402
+
+BASELINE_FILE = Path(__file__).resolve().parent / "baselines.json"
+
+DEFAULT_SIZES = "10,1000,50000"
+STEPS = ["parse", "load", "rss", "validate", "season", "upload"]
+# Differences smaller than this are timer noise, whatever the percentage
+MIN_DELTA_MS = 2.0
+# A slowdown must exceed this many times the step's (median - best) spread
+NOISE_FACTOR = 2.0
+
+
+class UploadStandIn(http.server.BaseHTTPRequestHandler):
+    """Accepts PUT uploads and discards the body, like a very fast S3."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 1 << 16)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInItem:
+    """internetarchive Item stand-in: upload() PUTs the file to the local server."""
+
+    def __init__(self, address):
+        self.connection = http.client.HTTPConnection(*address)
+
+    def upload(self, files, metadata=None, verbose=False):
+        path = Path(files)
+        with open(path, "rb") as f:
+            self.connection.request("PUT", f"/acoffeewithcompbio/{path.name}", body=f,
+                                    headers={"Content-Length": str(path.stat().st_size)})
+        self.connection.getresponse().read()
+
+
+@contextlib.contextmanager
+def upload_stand_in():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), UploadStandIn)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def timed(fn):
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    return (time.perf_counter() - started) * 1000
+
+
+def bench_size(workdir, episodes, runs, upload_limit, address):
+    """Time every step on a catalog of `episodes` episodes.
+
+    Returns {step: best ms} and {step: median - best ms}.
+    """
+    catalog_dir = workdir / f"catalog-{episodes}"
+    generate_catalog(catalog_dir, episodes)
+    md_texts = [p.read_text(encoding="utf-8") for p in sorted((catalog_dir / "episodes_markdown").glob("*.md"))]
+    audio_files = sorted((catalog_dir / "audio").glob("*.mp3"))[:upload_limit]
+    metadata_file = catalog_dir / "episode_metadata.json"
+
+    # Keep the probe cache with the catalog, not in the repo
+    audio_info.CACHE_FILE = catalog_dir / ".audio-probe-cache.json"
+    audio_info._cache = None
+
+    def parse():
+        for md_text in md_texts:
+            sections = parse_sections(md_text)
+            parse_metadata(sections["Metadata"])
+            build_description(sections["Description"], sections["Links"], sections["Footer"])
+
+    def upload():
+        item = StandInItem(address)
+        internetarchive = types.ModuleType("internetarchive")
+        internetarchive.get_item = lambda identifier: item
+        with mock.patch.dict(sys.modules, internetarchive=internetarchive):
+            for path in audio_files:
+                upload_audio(path)
+        item.connection.close()
+
+    previous_cwd = os.getcwd()
+    os.chdir(catalog_dir)  # feed.xml and the audio paths are relative to the cwd
+    try:
+        timed(lambda: generate_rss(verbose=False, catalog=load_catalog(metadata_file), validate=False))  # warm-up
+        samples = {step: [] for step in STEPS}
+        for _ in range(runs):
+            samples["parse"].append(timed(parse))
+            catalog = None
+
+            def load():
+                nonlocal catalog
+                catalog = load_catalog(metadata_file)
+
+            samples["load"].append(timed(load))
+            samples["rss"].append(timed(lambda: generate_rss(verbose=False, catalog=catalog, validate=False)))
+            samples["validate"].append(timed(lambda: validate(catalog_dir / "feed.xml")))
+            samples["season"].append(timed(lambda: (catalog_dir / "season2.html").write_text(
+                render_page(sorted(catalog.season(2), key=lambda e: e.number)), encoding="utf-8")))
+            samples["upload"].append(timed(upload))
+    finally:
+        os.chdir(previous_cwd)
+    best = {step: round(min(times), 2) for step, times in samples.items()}
+    spread = {step: statistics.median(times) - min(times) for step, times in samples.items()}
+    return best, spread
+
+
+def machine():
+    return {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()}
+
+
+def load_baselines():
+    if not BASELINE_FILE.exists():
+        return {"machine": None, "results": {}}
+    return json.loads(BASELINE_FILE.read_text())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="catalog sizes (default %(default)s)")
+    parser.add_argument("--runs", type=int, default=5, help="timed runs per step (default %(default)s)")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown vs baseline, as a fraction (default %(default)s)")
+    parser.add_argument("--upload-limit", type=int, default=200,
+                        help="audio files uploaded per run (default %(default)s)")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    baselines = load_baselines()
+    if baselines["machine"] and baselines["machine"] != machine() and not args.update_baseline:
+        print(f"⚠ Baselines were recorded on {baselines['machine']['platform']} "
+              f"(Python {baselines['machine']['python']}); comparisons may be off")
+
+    results = {}
+    regressions = []
+    print(f"{'episodes':>8} {'step':<8} {'best ms':>10} {'± ms':>7} {'µs/ep':>8} {'baseline':>9} {'change':>8}")
+    with tempfile.TemporaryDirectory(prefix="podcast-bench-") as workdir, upload_stand_in() as address:
+        for size in sizes:
+            timings, spreads = bench_size(Path(workdir), size, args.runs, args.upload_limit, address)
+            results[str(size)] = timings
+            base = baselines["results"].get(str(size), {})
+            for step in STEPS:
+                ms = timings[step]
+                per_episode = ms * 1000 / (min(size, args.upload_limit) if step == "upload" else size)
+                noise = max(MIN_DELTA_MS, NOISE_FACTOR * spreads[step])
+                line = f"{size:>8} {step:<8} {ms:>10.1f} {noise:>7.1f} {per_episode:>8.1f}"
+                if step in base:
+                    change = (ms - base[step]) / base[step] if base[step] else 0.0
+                    regressed = change > args.threshold and ms - base[step] > noise
+                    line += f" {base[step]:>9.1f} {change:>+8.0%}{'  ✗' if regressed else ''}"
+                    if regressed:
+                        regressions.append(f"{step} at {size} episodes: {base[step]:.1f} → {ms:.1f}ms")
+                print(line)
+
+    if args.update_baseline:
+        baselines["machine"] = machine()
+        baselines["results"].update(results)
+        BASELINE_FILE.write_text(json.dumps(baselines, indent=2) + "\n")
+        print(f"\n✓ Baselines written to {BASELINE_FILE.relative_to(ROOT)}")
+        return
+
+    if regressions:
+        print(f"\n✗ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print("\n✓ No regressions" if any(baselines["results"].values()) else "\nNo baseline yet; run with --update-baseline")
+
+
+if __name__ == "__main__":
+    main()
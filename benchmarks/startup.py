@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Startup-time benchmark for the compbio_podcast CLI.
+
+For every module behind a command, a fresh interpreter imports the CLI plus
+that module and reports how long the imports took and whether any heavy
+dependency (internetarchive, requests, feedparser, lxml) got loaded. Heavy
+dependencies must only be imported inside the functions that use them.
+
+Exits non-zero if a module loads a heavy dependency at import time or its
+imports take longer than the budget.
+
+Usage:
+    python benchmarks/startup.py [--runs 5] [--budget-ms 50]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = [
+    "parse_episode",
+    "upload",
+    "upload_all",
+    "rss",
+    "validate_feed",
+    "season2",
+    "feed_html",
+    "publish",
+    "preview",
+    "download",
+    "linkcheck",
+    "renditions",
+    "clips",
+    "analytics",
+]
+
+HEAVY = ["internetarchive", "requests", "feedparser", "lxml"]
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import compbio_podcast.cli
+import compbio_podcast.{module}
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({{"ms": elapsed, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def probe(module):
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="median import time allowed per module")
+    args = parser.parse_args()
+
+    failures = []
+    print(f"{'module':<16} {'median ms':>10} {'max ms':>8}  heavy imports")
+    for module in MODULES:
+        runs = [probe(module) for _ in range(args.runs)]
+        times = [run["ms"] for run in runs]
+        heavy = sorted({m for run in runs for m in run["heavy"]})
+        median = statistics.median(times)
+        print(f"{module:<16} {median:>10.1f} {max(times):>8.1f}  {', '.join(heavy) or '-'}")
+        if heavy:
+            failures.append(f"{module} imports {', '.join(heavy)} at import time")
+        if median > args.budget_ms:
+            failures.append(f"{module} takes {median:.1f}ms to import (budget {args.budget_ms:.0f}ms)")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"✗ {failure}")
+        sys.exit(1)
+    print(f"\n✓ All modules import within {args.budget_ms:.0f}ms without heavy dependencies")
+
+
+if __name__ == "__main__":
+    main()
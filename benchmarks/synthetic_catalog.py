@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic podcast catalog for benchmarking.
+
+Writes, under the output directory:
+    episodes_markdown/S##E####.md   episode files in the TEMPLATE.md format
+    episode_metadata.json           the metadata parse-episode would produce
+    audio/S##E####.mp3              tiny valid CBR MP3s (ID3 tag + a few frames)
+
+Episodes alternate between season 1 and season 2, so the season 2 page gets
+half the catalog. The content is deterministic for a given size.
+
+Usage:
+    python benchmarks/synthetic_catalog.py /tmp/catalog-1k --episodes 1000
+"""
+
+import argparse
+import json
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from compbio_podcast.parse_episode import parse_metadata, parse_sections  # noqa: E402
+from compbio_podcast.show_notes import store_footer  # noqa: E402
+
+WORDS = (
+    "single-cell spatial transcriptomics pipeline alignment reads genome clustering "
+    "deconvolution reproducible notebook workflow python bioinformatics variant "
+    "annotation benchmark dataset career hackathon collaboration statistics model"
+).split()
+
+# MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding: 417-byte frames
+MP3_FRAME = b"\xff\xfb\x90\x00" + b"\x00" * 413
+MP3_FRAMES = 4
+ID3_TAG = b"ID3\x03\x00\x00\x00\x00\x00\x10" + b"\x00" * 16
+
+EPISODE_TEMPLATE = """# S{season:02d}E{number:02d} Episode
+
+---
+
+## Metadata
+
+- **Season:** {season}
+- **Episode:** {number}
+- **Title:** {title}
+- **Published:** {published}
+- **Duration:** {duration}
+- **Audio File:** {audio_file}
+
+---
+
+## Description
+
+{description}
+
+---
+
+## Links
+
+{links}
+
+---
+
+## Footer
+
+Thanks to **Amulya Shastry** for editing and management support and **Dina Issakova** for social media support and the cover art!
+
+Follow us on LinkedIn: [Saba Nafees](https://www.linkedin.com/in/saba-nafees/) and [Sharvari Narendra](https://www.linkedin.com/in/sharvarinarendra/)
+"""
+
+
+def sentence(rng, words=14):
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def episode_markdown(rng, index):
+    season = 1 + index % 2
+    number = index // 2 + 1
+    published = datetime(2020, 1, 6, 12, tzinfo=timezone.utc) + timedelta(days=7 * index)
+    paragraphs = [" ".join(sentence(rng) for _ in range(4)) for _ in range(3)]
+    bullets = "\n".join(f"- {sentence(rng, 6)}" for _ in range(4))
+    links = "\n".join(
+        f"- [{sentence(rng, 3)[:-1]}](https://example.org/{season}/{number}/{i})" for i in range(5)
+    )
+    return season, number, EPISODE_TEMPLATE.format(
+        season=season,
+        number=number,
+        title=f"{sentence(rng, 5)[:-1]} #{index + 1}",
+        published=published.strftime("%a, %d %b %Y %H:%M:%S +0000"),
+        duration=f"{rng.randint(10, 59):02d}:{rng.randint(0, 59):02d}",
+        audio_file=f"S{season:02d}E{number:04d}.mp3",
+        description="\n\n".join(paragraphs[:2]) + "\n\n**What you'll learn:**\n" + bullets
+        + "\n\n" + paragraphs[2],
+        links=links,
+    )
+
+
+def metadata_entry(md_text):
+    """The episode_metadata.json entry for a generated file (no audio probing).
+
+    Like parse-episode's, it holds the footer text under "footer_md" until
+    store_footer() moves it to the shared blocks.
+    """
+    sections = parse_sections(md_text)
+    meta = parse_metadata(sections["Metadata"])
+    return {
+        "season": int(meta["Season"]),
+        "number": int(meta["Episode"]),
+        "title": meta["Title"],
+        "description_md": sections["Description"],
+        "links_md": sections["Links"],
+        "footer_md": sections["Footer"],
+        "published": meta["Published"],
+        "duration": meta["Duration"],
+        "original_audio_url": "",
+        "local_file": f"audio/{meta['Audio File']}",
+        "archive_url": "",
+    }
+
+
+def generate_catalog(out_dir, episodes, seed=0):
+    """Write a catalog of `episodes` episodes to `out_dir`; returns the metadata dict."""
+    out_dir = Path(out_dir)
+    markdown_dir = out_dir / "episodes_markdown"
+    audio_dir = out_dir / "audio"
+    markdown_dir.mkdir(parents=True, exist_ok=True)
+    audio_dir.mkdir(parents=True, exist_ok=True)
+
+    rng = random.Random(seed)
+    audio = ID3_TAG + MP3_FRAME * MP3_FRAMES
+    entries = []
+    for index in range(episodes):
+        season, number, md_text = episode_markdown(rng, index)
+        name = f"S{season:02d}E{number:04d}"
+        (markdown_dir / f"{name}.md").write_text(md_text, encoding="utf-8")
+        (audio_dir / f"{name}.mp3").write_bytes(audio)
+        entries.append(metadata_entry(md_text))
+
+    metadata = {
+        "podcast_title": "A Coffee with CompBio (synthetic)",
+        "podcast_description": "Synthetic catalog for benchmarks.",
+        "episodes": entries[::-1],  # newest first, like the real file
+    }
+    for entry in entries:
+        store_footer(metadata, entry)
+    (out_dir / "episode_metadata.json").write_text(
+        json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8")
+    return metadata
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("out_dir", help="directory to write the catalog to")
+    parser.add_argument("--episodes", type=int, default=1000, help="number of episodes (default %(default)s)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generate_catalog(args.out_dir, args.episodes, args.seed)
+    print(f"✓ Wrote {args.episodes} episodes to {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
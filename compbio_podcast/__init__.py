@@ -0,0 +1,7 @@
+"""
+Tools for the self-hosted A Coffee with CompBio podcast.
+
+Run `python -m compbio_podcast --help` for the commands. Modules only import
+their heavy dependencies (internetarchive, requests, feedparser, lxml) inside
+the functions that need them, so importing this package stays cheap.
+"""
@@ -0,0 +1,277 @@
+"""
+Count episode downloads from web server access logs.
+
+Reads access logs in Common or Combined Log Format, plain or gzip-compressed,
+in a single streaming pass. Memory use does not grow with the log size:
+
+- Downloads are counted per enclosure file, de-duplicated the IAB way. Only
+  GET requests answered 200/206 by non-bot user agents count. Requests from
+  the same IP + user agent for the same file on the same day are one
+  download, counted once they have transferred at least MIN_DOWNLOAD_BYTES
+  (about a minute of audio). Only the keys of the newest day seen and the
+  day before are kept, as 8-byte hashes, so logs are read oldest first
+  (ordered by their first timestamp, whatever order they are given in);
+  requests older than that window are skipped with a warning.
+- Unique listeners (IP + user agent) are estimated with HyperLogLog
+  sketches: one for the whole podcast, one per episode.
+
+Files are matched to episodes by name: the archive_url, local_file and
+renditions recorded in episode_metadata.json.
+
+The summary goes to download_stats.json, which generate-season2 reads to
+show download counts on the season page.
+
+Usage:
+    python -m compbio_podcast analytics access.log [access.log.1.gz ...]
+    # or:
+    pixi run analytics logs/*.gz
+"""
+
+import gzip
+import hashlib
+import json
+import math
+import re
+import sys
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+from .paths import ROOT
+from .tracing import span
+
+SUMMARY_FILE = ROOT / "download_stats.json"
+
+AUDIO_EXTENSIONS = (".mp3", ".m4a", ".opus", ".ogg", ".aac")
+# Roughly one minute of 128 kbps audio
+MIN_DOWNLOAD_BYTES = 960_000
+
+LOG_LINE_RE = re.compile(
+    r'(?P<ip>\S+) \S+ \S+ \[(?P<day>[^:\]]+)[^\]]*\] '
+    r'"(?P<method>[A-Z]+) (?P<path>\S+)[^"]*" (?P<status>\d{3}) (?P<bytes>\d+|-)'
+    r'(?: "[^"]*" "(?P<agent>[^"]*)")?'
+)
+TIMESTAMP_RE = re.compile(r"\[(\d{2}/\w{3}/\d{4}:\d{2}:\d{2}:\d{2} [+-]\d{4})\]")
+# Lines read from the top of a log to find its first timestamp
+START_PROBE_LINES = 100
+BOT_RE = re.compile(
+    r"bot|crawl|spider|slurp|curl|wget|python-requests|httpclient|go-http-client|"
+    r"okhttp/[0-3]\.|facebookexternalhit|preview|monitor|headless",
+    re.I,
+)
+
+
+class HyperLogLog:
+    """Cardinality sketch: 2**p one-byte registers, ~1.04/sqrt(2**p) error."""
+
+    __slots__ = ("p", "registers")
+
+    def __init__(self, p=12):
+        self.p = p
+        self.registers = bytearray(1 << p)
+
+    def add_hash(self, value):
+        """Add a 64-bit hash."""
+        index = value >> (64 - self.p)
+        rest = value & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self):
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+
+def hash64(text):
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "big")
+
+
+def open_log(path):
+    """Open a log as text, transparently decompressing gzip."""
+    with open(path, "rb") as f:
+        gzipped = f.read(2) == b"\x1f\x8b"
+    if gzipped:
+        return gzip.open(path, "rt", encoding="utf-8", errors="replace")
+    return open(path, "r", encoding="utf-8", errors="replace")
+
+
+def log_start(path):
+    """Timestamp of the first request in a log (datetime.max if none is found)."""
+    with open_log(path) as f:
+        for _, line in zip(range(START_PROBE_LINES), f):
+            match = TIMESTAMP_RE.search(line)
+            if match:
+                return datetime.strptime(match[1], "%d/%b/%Y:%H:%M:%S %z")
+    return datetime.max.replace(tzinfo=timezone.utc)
+
+
+def episode_files(catalog):
+    """Map audio file name → episode for the originals and their renditions."""
+    files = {}
+    for episode in catalog.episodes:
+        urls = [episode.archive_url, episode.local_file]
+        urls += [r.get("archive_url") or r.get("file") for r in episode.renditions]
+        for url in urls:
+            if url:
+                files[Path(urlparse(url).path).name] = episode
+    return files
+
+
+class DownloadCounter:
+    """Streaming IAB-style download counter over parsed log lines.
+
+    Unique listeners per file are only estimated for the names in `files`
+    (the catalog's audio): each sketch is 4 KB, and scanners request any
+    number of made-up .mp3 paths.
+    """
+
+    def __init__(self, files=()):
+        self.downloads = Counter()          # file name → downloads
+        self.daily = Counter()              # "10/Oct/2026" → downloads
+        self.listeners = HyperLogLog(14)
+        self.episode_listeners = {}         # file name → HyperLogLog
+        self.files = frozenset(files)
+        self.lines = 0
+        self.matched = 0
+        self.skipped = 0                    # requests older than the dedupe window
+        # day → {hash(ip, agent, file): bytes so far, or -1 once counted}
+        self._days = {}
+
+    def add_line(self, line):
+        self.lines += 1
+        # Cheap pre-filter: most lines are pages, images and feeds
+        if not any(ext in line for ext in AUDIO_EXTENSIONS):
+            return
+        match = LOG_LINE_RE.match(line)
+        if not match or match["method"] != "GET" or match["status"] not in ("200", "206"):
+            return
+        name = Path(unquote(urlparse(match["path"]).path)).name
+        if not name.lower().endswith(AUDIO_EXTENSIONS):
+            return
+        agent = match["agent"] or ""
+        if BOT_RE.search(agent):
+            return
+        self.matched += 1
+
+        listener = hash64(f"{match['ip']}\0{agent}")
+        self.listeners.add_hash(listener)
+        if name in self.files:
+            sketch = self.episode_listeners.get(name)
+            if sketch is None:
+                sketch = self.episode_listeners[name] = HyperLogLog()
+            sketch.add_hash(listener)
+
+        day = match["day"]
+        seen = self._window(day)
+        if seen is None:
+            self.skipped += 1
+            return
+        key = listener ^ hash64(name)
+        sent = int(match["bytes"]) if match["bytes"] != "-" else 0
+        total = seen.get(key, 0)
+        if total < 0:
+            return      # already counted today
+        total += sent
+        if total >= MIN_DOWNLOAD_BYTES:
+            self.downloads[name] += 1
+            self.daily[day] += 1
+            total = -1
+        seen[key] = total
+
+    def _window(self, day):
+        """Dedupe state for `day`, or None if it is older than the two
+        most recent days seen (whose state is all that is kept)."""
+        seen = self._days.get(day)
+        if seen is None:
+            if len(self._days) == 2 and _parse_day(day) < min(map(_parse_day, self._days)):
+                return None
+            seen = self._days[day] = {}
+            if len(self._days) > 2:
+                oldest = min(self._days, key=_parse_day)
+                del self._days[oldest]
+        return seen
+
+    def summary(self, files, logs):
+        episodes = {}
+        for name, count in self.downloads.most_common():
+            episode = files.get(name)
+            sketch = self.episode_listeners.get(name)
+            episodes[name] = {
+                "title": episode.title if episode else None,
+                "season": episode.season if episode else None,
+                "number": episode.number if episode else None,
+                "downloads": count,
+                "unique_listeners": sketch.estimate() if sketch else None,
+            }
+        return {
+            "generated": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "logs": [Path(log).name for log in logs],
+            "lines": self.lines,
+            "audio_requests": self.matched,
+            "downloads": sum(self.downloads.values()),
+            "unique_listeners": self.listeners.estimate(),
+            "episodes": episodes,
+            "daily": {_parse_day(day).strftime("%Y-%m-%d"): n
+                      for day, n in sorted(self.daily.items(), key=lambda item: _parse_day(item[0]))},
+        }
+
+
+def _parse_day(day):
+    return datetime.strptime(day, "%d/%b/%Y")
+
+
+def episode_downloads(summary):
+    """Downloads per (season, number), adding up the original and renditions."""
+    totals = Counter()
+    for entry in summary.get("episodes", {}).values():
+        if entry.get("number") is not None:
+            totals[entry["season"], entry["number"]] += entry["downloads"]
+    return totals
+
+
+def load_summary(path=SUMMARY_FILE):
+    """The last written summary, or {} if analytics hasn't been run."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+
+
+def main(logs, output=None):
+    output = output or SUMMARY_FILE
+    from .episodes import load_catalog
+
+    missing = [log for log in logs if not Path(log).exists()]
+    if missing:
+        print(f"Error: log file(s) not found: {', '.join(map(str, missing))}")
+        sys.exit(1)
+
+    files = episode_files(load_catalog())
+    counter = DownloadCounter(files)
+    # Oldest first, so each day is de-duplicated before the window moves on
+    logs = sorted(logs, key=log_start)
+    for log in logs:
+        with span("analyze", path=str(log)) as s, open_log(log) as f:
+            for line in f:
+                counter.add_line(line)
+            s.add_bytes(Path(log).stat().st_size)
+
+    summary = counter.summary(files, logs)
+    Path(output).write_text(json.dumps(summary, indent=1, ensure_ascii=False) + "\n", encoding="utf-8")
+    print(f"✓ {counter.lines:,} log lines → {summary['downloads']:,} downloads, "
+          f"~{summary['unique_listeners']:,} unique listeners")
+    if counter.skipped:
+        print(f"⚠ Skipped {counter.skipped:,} request(s) older than the day before the newest one seen; "
+              f"are the lines within a log out of order?")
+    for name, entry in list(summary["episodes"].items())[:10]:
+        label = f"S{entry['season'] or 0:02d}E{entry['number']:02d}" if entry["number"] is not None else "?"
+        print(f"  {label:<7} {entry['downloads']:>7,}  {entry['title'] or name}")
+    print(f"Summary written to {output}")
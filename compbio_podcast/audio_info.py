@@ -0,0 +1,339 @@
+"""
+Read duration, bitrate, sample rate and container of an audio file from its
+headers, without decoding any audio.
+
+MP3: skip the ID3v2 tag, find the first MPEG frame, and take the frame count
+from its Xing/Info or VBRI header. Without one (plain CBR) the duration is
+worked out from the audio byte count and the bitrate.
+MP4/M4A: walk the top-level boxes by seeking over them (so a large mdat
+is never read), take the duration from moov/mvhd and the sample rate
+from the first audio sample entry in stsd.
+
+Results are cached in .audio-probe-cache.json, keyed by a fingerprint of
+the file (its size plus the first and last 64 KiB), so re-running a build
+over an unchanged season directory does not parse anything.
+
+Usage:
+    from compbio_podcast.audio_info import probe_cached
+    info = probe_cached("audio/Season_2_Episode_2.mp3")
+    info.duration, info.mime_type
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from .paths import ROOT
+from .tracing import span
+
+CACHE_FILE = ROOT / ".audio-probe-cache.json"
+
+# Bytes read at each end of the file for the cache fingerprint
+FINGERPRINT_BYTES = 64 * 1024
+# How far past the ID3 tag to look for the first MPEG frame
+MP3_SCAN_BYTES = 64 * 1024
+
+# Enclosure types by extension, for files that can't be probed
+MIME_TYPES = {
+    ".mp3": "audio/mpeg",
+    ".m4a": "audio/x-m4a",
+    ".mp4": "audio/x-m4a",
+    ".aac": "audio/aac",
+    ".ogg": "audio/ogg",
+    ".opus": "audio/ogg",
+}
+
+
+class AudioInfo(NamedTuple):
+    container: str      # "mp3" or "mp4"
+    mime_type: str
+    duration: float     # seconds
+    bitrate: int        # bits per second (average for VBR)
+    sample_rate: int    # Hz
+
+
+def format_duration(seconds):
+    """Seconds → itunes:duration text, 'MM:SS' or 'H:MM:SS'."""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+
+def mime_type_for(filename):
+    """Enclosure type guessed from the file extension (audio/mpeg if unknown)."""
+    return MIME_TYPES.get(Path(filename).suffix.lower(), "audio/mpeg")
+
+
+# -- MP3 ----------------------------------------------------------------------
+
+# kbps by [MPEG-1?][layer]; index 0 is "free", 15 is invalid
+MP3_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Hz by version bits: 0 = MPEG-2.5, 2 = MPEG-2, 3 = MPEG-1
+MP3_SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+
+class _Frame(NamedTuple):
+    mpeg1: bool
+    layer: int
+    bitrate: int        # bps
+    sample_rate: int
+    samples: int        # per frame
+    length: int         # bytes
+    mono: bool
+
+
+def _mp3_frame(header):
+    """Decode a 4-byte MPEG audio frame header, or None if it isn't one."""
+    if len(header) < 4:
+        return None
+    h = int.from_bytes(header[:4], "big")
+    if h >> 21 != 0x7FF:
+        return None
+    version = (h >> 19) & 3
+    layer = 4 - ((h >> 17) & 3)
+    bitrate_index = (h >> 12) & 0xF
+    rate_index = (h >> 10) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = MP3_BITRATES[mpeg1, layer][bitrate_index] * 1000
+    sample_rate = MP3_SAMPLE_RATES[version][rate_index]
+    padding = (h >> 9) & 1
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if mpeg1 or layer == 2 else 576
+        length = samples // 8 * bitrate // sample_rate + padding
+    return _Frame(mpeg1, layer, bitrate, sample_rate, samples, length, (h >> 6) & 3 == 3)
+
+
+def _id3v2_size(head):
+    """Bytes taken by an ID3v2 tag at the start of the file (0 if none)."""
+    if len(head) < 10 or head[:3] != b"ID3":
+        return 0
+    size = 0
+    for byte in head[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if head[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _probe_mp3(f, file_size):
+    f.seek(0)
+    audio_start = _id3v2_size(f.read(10))
+    f.seek(audio_start)
+    buf = f.read(MP3_SCAN_BYTES)
+
+    # First frame sync whose following frame also syncs (avoids false matches)
+    pos = buf.find(b"\xff")
+    while pos != -1:
+        frame = _mp3_frame(buf[pos:pos + 4])
+        if frame:
+            following = pos + frame.length
+            if following + 4 > len(buf) or _mp3_frame(buf[following:following + 4]):
+                break
+        pos = buf.find(b"\xff", pos + 1)
+    else:
+        raise ValueError("no MPEG audio frame found")
+
+    audio_end = file_size
+    f.seek(max(file_size - 128, 0))
+    if f.read(3) == b"TAG":
+        audio_end -= 128
+
+    # VBR header inside the first frame: Xing/Info after the side info, or VBRI
+    side_info = (17 if frame.mono else 32) if frame.mpeg1 else (9 if frame.mono else 17)
+    xing = pos + 4 + side_info
+    frames = audio_bytes = None
+    if buf[xing:xing + 4] in (b"Xing", b"Info"):
+        flags = int.from_bytes(buf[xing + 4:xing + 8], "big")
+        field = xing + 8
+        if flags & 1:
+            frames = int.from_bytes(buf[field:field + 4], "big")
+            field += 4
+        if flags & 2:
+            audio_bytes = int.from_bytes(buf[field:field + 4], "big")
+    elif buf[pos + 36:pos + 40] == b"VBRI":
+        audio_bytes, frames = struct.unpack(">II", buf[pos + 46:pos + 54])
+
+    if frames:
+        duration = frames * frame.samples / frame.sample_rate
+        if not audio_bytes:
+            audio_bytes = audio_end - audio_start - pos
+        bitrate = int(audio_bytes * 8 / duration) if duration else frame.bitrate
+    else:
+        bitrate = frame.bitrate
+        duration = (audio_end - audio_start - pos) * 8 / bitrate
+    return AudioInfo("mp3", "audio/mpeg", duration, bitrate, frame.sample_rate)
+
+
+# -- MP4 ----------------------------------------------------------------------
+
+AUDIO_SAMPLE_ENTRIES = {b"mp4a", b"alac", b"Opus", b"fLaC", b"ac-3", b"ec-3"}
+
+
+def _boxes(f, start, end):
+    """Yield (type, payload_start, box_end) for the boxes in [start, end)."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            raise ValueError(f"corrupt MP4 box {kind!r} at offset {pos}")
+        yield kind, pos + header, min(pos + size, end)
+        pos += size
+
+
+def _find_box(f, start, end, path):
+    """Payload range of the first box at `path` (e.g. [b"trak", b"mdia"])."""
+    for kind, payload, box_end in _boxes(f, start, end):
+        if kind == path[0]:
+            if len(path) == 1:
+                return payload, box_end
+            found = _find_box(f, payload, box_end, path[1:])
+            if found:
+                return found
+    return None
+
+
+def _sample_rate(f, moov_start, moov_end):
+    """Sample rate of the first audio track's sample entry, or 0."""
+    for kind, payload, box_end in _boxes(f, moov_start, moov_end):
+        if kind != b"trak":
+            continue
+        stsd = _find_box(f, payload, box_end, [b"mdia", b"minf", b"stbl", b"stsd"])
+        if not stsd:
+            continue
+        # full box header (4) + entry count (4), then the first sample entry
+        f.seek(stsd[0] + 8)
+        entry = f.read(36)
+        if len(entry) == 36 and entry[4:8] in AUDIO_SAMPLE_ENTRIES:
+            return struct.unpack(">I", entry[32:36])[0] >> 16
+    return 0
+
+
+def _probe_mp4(f, file_size):
+    moov = None
+    media_bytes = 0
+    for kind, payload, box_end in _boxes(f, 0, file_size):
+        if kind == b"moov":
+            moov = (payload, box_end)
+        elif kind == b"mdat":
+            media_bytes += box_end - payload
+    if moov is None:
+        raise ValueError("MP4 file has no moov box")
+
+    mvhd = _find_box(f, *moov, [b"mvhd"])
+    if mvhd is None:
+        raise ValueError("MP4 file has no mvhd box")
+    f.seek(mvhd[0])
+    version = f.read(1)[0]
+    if version == 1:
+        f.seek(mvhd[0] + 20)
+        timescale, length = struct.unpack(">IQ", f.read(12))
+    else:
+        f.seek(mvhd[0] + 12)
+        timescale, length = struct.unpack(">II", f.read(8))
+    if not timescale:
+        raise ValueError("MP4 mvhd has a zero timescale")
+
+    duration = length / timescale
+    bitrate = int(media_bytes * 8 / duration) if duration else 0
+    return AudioInfo("mp4", "audio/x-m4a", duration, bitrate, _sample_rate(f, *moov))
+
+
+# -- entry points -------------------------------------------------------------
+
+def probe(path):
+    """Read an audio file's headers. Raises ValueError if the format is unknown."""
+    path = Path(path)
+    with span("probe", path=str(path)), open(path, "rb") as f:
+        file_size = os.fstat(f.fileno()).st_size
+        head = f.read(12)
+        if head[4:8] == b"ftyp":
+            return _probe_mp4(f, file_size)
+        if head[:3] == b"ID3" or _mp3_frame(head) or path.suffix.lower() == ".mp3":
+            return _probe_mp3(f, file_size)
+    raise ValueError(f"{path.name}: not an MP3 or MP4 audio file")
+
+
+def fingerprint(path):
+    """Cheap content hash: file size plus its first and last 64 KiB."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        digest.update(str(size).encode())
+        digest.update(f.read(FINGERPRINT_BYTES))
+        if size > FINGERPRINT_BYTES:
+            f.seek(max(size - FINGERPRINT_BYTES, FINGERPRINT_BYTES))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _load_cache():
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(CACHE_FILE.read_text())
+        except (FileNotFoundError, ValueError):
+            _cache = {}
+    return _cache
+
+
+_cache_dirty = False
+
+
+def probe_cached(path, save=True):
+    """probe() with results cached by file fingerprint.
+
+    Pass save=False when probing many files and call save_cache() once at
+    the end, rather than rewriting the cache file after every new entry.
+    """
+    global _cache_dirty
+    key = fingerprint(path)
+    with _cache_lock:
+        cached = _load_cache().get(key)
+    if cached:
+        return AudioInfo(*cached)
+
+    info = probe(path)
+    with _cache_lock:
+        _load_cache()[key] = list(info)
+        _cache_dirty = True
+    if save:
+        save_cache()
+    return info
+
+
+def save_cache():
+    """Write new probe results to CACHE_FILE."""
+    global _cache_dirty
+    with _cache_lock:
+        if _cache_dirty:
+            CACHE_FILE.write_text(json.dumps(_cache, indent=1))
+            _cache_dirty = False
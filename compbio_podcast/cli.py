@@ -0,0 +1,225 @@
+"""
+Command-line interface for the podcast tools.
+
+Usage:
+    python -m compbio_podcast <command> [options]
+
+Every command imports its module only when it runs, so quick commands such
+as generate-rss never load internetarchive, requests, feedparser or lxml.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from .paths import ROOT
+
+# Optional dependency → pip package, for the "not installed" hint
+PIP_PACKAGES = {
+    "internetarchive": "internetarchive",
+    "requests": "requests",
+    "feedparser": "feedparser",
+    "lxml": "lxml",
+}
+
+
+def cmd_parse_episode(args):
+    from .parse_episode import main
+    main(args.file)
+
+
+def cmd_upload_single(args):
+    from .upload import upload_single_file
+    sys.exit(0 if upload_single_file(args.file) else 1)
+
+
+def cmd_upload_all(args):
+    from .upload_all import main
+    main()
+
+
+def cmd_generate_rss(args):
+    from .rss import generate_rss
+    try:
+        generate_rss(minify=args.minify, plain_description=args.plain_description)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+
+def cmd_validate_feed(args):
+    from .validate_feed import main
+    main(args.feed)
+
+
+def cmd_generate_season2(args):
+    from .season2 import generate
+    generate(minify=args.minify)
+
+
+def cmd_render_feed(args):
+    from .feed_html import render_feed_html
+    render_feed_html(force=args.force, minify=args.minify)
+
+
+def cmd_publish(args):
+    from .publish import main
+    main(args.episodes, force=args.force, upload=not args.no_upload, jobs=args.jobs,
+         profile=args.profile, trace_file=args.trace_file, minify=args.minify,
+         plain_description=args.plain_description, renditions=args.renditions,
+         clips=args.clips)
+
+
+def cmd_clips(args):
+    from .clips import main
+    main(jobs=args.jobs)
+
+
+def cmd_transcode(args):
+    from .renditions import main
+    main(jobs=args.jobs)
+
+
+def cmd_preview(args):
+    from .preview import main
+    main(port=args.port, watch=args.watch)
+
+
+def cmd_download(args):
+    from .download import RSS_FEED_URL, mirror, sync
+    feed_url = args.feed_url or RSS_FEED_URL
+    if args.sync:
+        sync(feed_url)
+    else:
+        mirror(feed_url)
+
+
+def cmd_check_links(args):
+    from .linkcheck import main
+    main(args.urls, refresh=args.refresh, jobs=args.jobs)
+
+
+def add_output_options(parser, plain_description=False):
+    parser.add_argument("--minify", action="store_true",
+                        help="strip insignificant whitespace from the generated files")
+    if plain_description:
+        parser.add_argument("--plain-description", action="store_true",
+                            help="plain-text <description>; <content:encoded> only when it adds markup")
+
+
+def cmd_analytics(args):
+    from .analytics import main
+    main(args.logs, output=args.output)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m compbio_podcast",
+        description="Build and publish the A Coffee with CompBio podcast.",
+    )
+    commands = parser.add_subparsers(dest="command", metavar="<command>", required=True)
+
+    sub = commands.add_parser("parse-episode", help="add an episode markdown file to episode_metadata.json")
+    sub.add_argument("file", help="path to the episode .md file")
+    sub.set_defaults(func=cmd_parse_episode, path_args=["file"])
+
+    sub = commands.add_parser("upload-single", help="upload one audio file to Internet Archive")
+    sub.add_argument("file", help="path to the audio file")
+    sub.set_defaults(func=cmd_upload_single, path_args=["file"])
+
+    sub = commands.add_parser("upload-all", help="upload every episode's audio to Internet Archive")
+    sub.set_defaults(func=cmd_upload_all)
+
+    sub = commands.add_parser("generate-rss", help="generate feed.xml from the metadata")
+    add_output_options(sub, plain_description=True)
+    sub.set_defaults(func=cmd_generate_rss)
+
+    sub = commands.add_parser("validate-feed", help="check feed.xml (well-formed, enclosures, guids, dates)")
+    sub.add_argument("feed", nargs="?", help="feed to check (default: feed.xml)")
+    sub.set_defaults(func=cmd_validate_feed, path_args=["feed"])
+
+    sub = commands.add_parser("generate-season2", help="regenerate season2.html from the metadata")
+    add_output_options(sub)
+    sub.set_defaults(func=cmd_generate_season2)
+
+    sub = commands.add_parser("render-feed", help="pre-render feed.html from feed.xml + rss.xslt")
+    sub.add_argument("--force", action="store_true", help="render even if the inputs are unchanged")
+    add_output_options(sub)
+    sub.set_defaults(func=cmd_render_feed)
+
+    sub = commands.add_parser("publish", help="parse, upload and regenerate everything that changed")
+    sub.add_argument("episodes", nargs="*", help="episode markdown files to parse")
+    sub.add_argument("--force", action="store_true", help="run every stage even if unchanged")
+    sub.add_argument("--no-upload", action="store_true", help="skip Internet Archive uploads")
+    sub.add_argument("--jobs", type=int, help="stages to run at once (default 4)")
+    sub.add_argument("--profile", action="store_true",
+                     help="record timings, bytes and peak memory of each step")
+    sub.add_argument("--trace-file", default="publish-trace.json",
+                     help="where --profile writes its Chrome trace JSON (default: %(default)s)")
+    sub.add_argument("--renditions", action="store_true",
+                     help="encode, upload and list low-bitrate renditions of the audio")
+    sub.add_argument("--clips", action="store_true",
+                     help="cut preview clips for the season page players")
+    add_output_options(sub, plain_description=True)
+    sub.set_defaults(func=cmd_publish, path_args=["episodes", "trace_file"])
+
+    sub = commands.add_parser("transcode", help="encode low-bitrate Opus/AAC renditions with ffmpeg")
+    sub.add_argument("--jobs", type=int, help="ffmpeg processes at once (default: half the CPUs)")
+    sub.set_defaults(func=cmd_transcode)
+
+    sub = commands.add_parser("clips", help="cut short preview clips for the season page with ffmpeg")
+    sub.add_argument("--jobs", type=int, help="ffmpeg processes at once (default: half the CPUs)")
+    sub.set_defaults(func=cmd_clips)
+
+    sub = commands.add_parser("preview", help="serve the site locally")
+    sub.add_argument("--port", type=int, default=8000, help="port to listen on (default %(default)s)")
+    sub.add_argument("--watch", action="store_true",
+                     help="rebuild outputs when their inputs change and reload the browser")
+    sub.set_defaults(func=cmd_preview)
+
+    sub = commands.add_parser("check-links", help="check the links in the episode show notes")
+    sub.add_argument("urls", nargs="*", help="check these URLs instead of the show notes")
+    sub.add_argument("--refresh", action="store_true", help="ignore cached results")
+    sub.add_argument("--jobs", type=int, help="requests in flight at once (default 16)")
+    sub.set_defaults(func=cmd_check_links)
+
+    sub = commands.add_parser("analytics", help="count episode downloads from access logs")
+    sub.add_argument("logs", nargs="+", help="access logs (Common/Combined format, plain or .gz)")
+    sub.add_argument("--output", help="summary file (default: download_stats.json, which the season page reads)")
+    sub.set_defaults(func=cmd_analytics, path_args=["logs", "output"])
+
+    sub = commands.add_parser("download", help="mirror the source RSS feed (migration only)")
+    sub.add_argument("--feed-url", help="source RSS feed (default: the Ausha feed)")
+    sub.add_argument("--sync", action="store_true",
+                     help="only merge new or changed episodes into episode_metadata.json")
+    sub.set_defaults(func=cmd_download)
+
+    return parser
+
+
+def resolve_paths(args):
+    """Make user-supplied paths absolute before changing to the repo root."""
+    for name in getattr(args, "path_args", []):
+        value = getattr(args, name)
+        if isinstance(value, list):
+            setattr(args, name, [str(Path(v).resolve()) for v in value])
+        elif value:
+            setattr(args, name, str(Path(value).resolve()))
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    resolve_paths(args)
+
+    # episode_metadata.json stores audio paths relative to the repo root
+    os.chdir(ROOT)
+    try:
+        args.func(args)
+    except ImportError as e:
+        package = PIP_PACKAGES.get((e.name or "").split(".")[0])
+        if package is None:
+            raise
+        print(f"Error: {package} package not installed")
+        print(f"Install with: pip install {package}")
+        sys.exit(1)
@@ -0,0 +1,187 @@
+"""
+Short preview clips of the episodes for the player on the season pages.
+
+Each episode with a local audio file gets a 75-second clip, starting a
+minute in to skip the intro. The clip is published with the site, so a
+visitor sampling an episode downloads well under a megabyte instead of the
+full file from the Internet Archive.
+
+Clips are cut from the episode's AAC rendition when it has one (see
+renditions.py), otherwise from the original. A low-bitrate MP3 or AAC
+source is cut by stream copy (no re-encoding, so it takes milliseconds).
+Anything else is encoded to mono 48 kbps AAC with a short fade at each end,
+several ffmpeg processes at a time. Clips are named after the SHA-256 of their source, so
+an unchanged episode is never cut again; clips of replaced audio files are
+deleted.
+
+The clip is recorded on the episode in episode_metadata.json:
+
+    "clip": {"file": "clips/S02E02.3f9a1c2b7d4e.m4a", "type": "audio/mp4",
+             "start": 60, "duration": 75, "source_sha256": "..."}
+
+and generate-season2 embeds it as <audio preload="none">.
+
+Usage:
+    python -m compbio_podcast clips [--jobs 4]
+    # or, as part of a publish:
+    python -m compbio_podcast publish --clips
+"""
+
+import json
+import re
+import shutil
+import sys
+from functools import partial
+from pathlib import Path
+
+from .audio_info import probe_cached, save_cache
+from .paths import METADATA_FILE, ROOT
+from .renditions import MAX_WORKERS, run_ffmpeg, source_hash
+
+CLIPS_DIR = Path("clips")
+
+CLIP_START = 60         # seconds into the episode
+CLIP_SECONDS = 75
+FADE_SECONDS = 1.5
+CLIP_BITRATE = 48000
+# Sources up to this bitrate are cut by stream copy rather than re-encoded
+COPY_MAX_BITRATE = 64000
+
+# Containers ffmpeg can stream-copy into a file the <audio> element plays
+COPY_FORMATS = {"mp3": (".mp3", "audio/mpeg", "mp3"), "mp4": (".m4a", "audio/mp4", "mp4")}
+ENCODE_FORMAT = (".m4a", "audio/mp4", "mp4")
+# File names clip_name() produces; nothing else in clips/ is ever pruned
+CLIP_NAME_RE = re.compile(r"S\d{2,}E\d{2,}\.[0-9a-f]{12}\.(?:mp3|m4a)")
+
+
+def clip_window(duration):
+    """(start, length) of the clip for an episode of `duration` seconds."""
+    if duration >= CLIP_START + CLIP_SECONDS:
+        return CLIP_START, CLIP_SECONDS
+    return 0, int(min(duration, CLIP_SECONDS))
+
+
+def clip_plan(info):
+    """(stream copy?, (extension, MIME type, ffmpeg format)) for a probed source."""
+    if info.container in COPY_FORMATS and 0 < info.bitrate <= COPY_MAX_BITRATE:
+        return True, COPY_FORMATS[info.container]
+    return False, ENCODE_FORMAT
+
+
+def clip_source(episode, digest):
+    """(path, AudioInfo) to cut from: the AAC rendition of this audio if it's
+    here and readable, else the original. Raises ValueError if neither is."""
+    candidates = [
+        rendition["file"] for rendition in episode.get("renditions", [])
+        if rendition.get("name") == "aac" and rendition.get("source_sha256") == digest
+        and Path(rendition["file"]).exists()
+    ]
+    for path in candidates:
+        try:
+            return path, probe_cached(path, save=False)
+        except ValueError:
+            pass
+    return episode["local_file"], probe_cached(episode["local_file"], save=False)
+
+
+def clip_name(episode, digest, ext):
+    """Web-safe file name: the episode code plus the source hash."""
+    return CLIPS_DIR / f"S{episode.get('season') or 0:02d}E{episode['number']:02d}.{digest[:12]}{ext}"
+
+
+def ffmpeg_command(source, output, *, start, length, copy, fmt):
+    command = [
+        "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+        "-ss", str(start), "-t", str(length), "-i", str(source), "-vn", "-map_metadata", "-1",
+    ]
+    if copy:
+        command += ["-c:a", "copy"]
+    else:
+        fades = f"afade=t=in:d={FADE_SECONDS},afade=t=out:st={length - FADE_SECONDS}:d={FADE_SECONDS}"
+        command += ["-ac", "1", "-af", fades, "-c:a", "aac", "-b:a", f"{CLIP_BITRATE // 1000}k"]
+    if fmt == "mp4":
+        # moov first, so the player can start before the whole clip is in
+        command += ["-movflags", "+faststart"]
+    return command + ["-f", fmt, str(output)]
+
+
+def cut_clips(episodes, max_workers=MAX_WORKERS):
+    """Make sure every episode with local audio has an up-to-date clip.
+
+    Updates each episode dict's "clip" in place, deletes clips no episode
+    uses any more, and returns the episodes that changed. Raises
+    RuntimeError if ffmpeg is missing or fails.
+    """
+    jobs = []       # (episode, clip entry, ffmpeg command for an output path)
+    for episode in episodes:
+        local_file = episode.get("local_file")
+        if not local_file or not Path(local_file).exists():
+            continue
+        digest = source_hash(local_file)
+        previous = episode.get("clip")
+        if previous and previous.get("source_sha256") == digest and Path(previous["file"]).exists():
+            continue
+        try:
+            source, info = clip_source(episode, digest)
+        except ValueError as e:
+            print(f"  ⚠ Skipping {local_file}: {e}")
+            continue
+        copy, (ext, mime_type, fmt) = clip_plan(info)
+        start, length = clip_window(info.duration)
+        if length < 2 * FADE_SECONDS:
+            continue
+        output = clip_name(episode, digest, ext)
+        entry = {"file": str(output), "type": mime_type, "start": start, "duration": length,
+                 "source_sha256": digest}
+        command = partial(ffmpeg_command, source, start=start, length=length, copy=copy, fmt=fmt)
+        jobs.append((episode, entry, command))
+    save_cache()
+
+    # Cut before (e.g. by a run whose metadata wasn't committed)
+    for episode, entry, _ in jobs:
+        if Path(entry["file"]).exists():
+            episode["clip"] = entry
+    to_cut = [job for job in jobs if not Path(job[1]["file"]).exists()]
+    if to_cut and shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg not found. Install it with: pixi add ffmpeg (or your package manager)")
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(run_ffmpeg, command, entry["file"]): (episode, entry)
+                   for episode, entry, command in to_cut}
+        for future in as_completed(futures):
+            future.result()
+            episode, entry = futures[future]
+            episode["clip"] = entry
+            print(f"  ✓ Cut {entry['file']}")
+
+    prune_clips(episodes)
+    return [episode for episode, _, _ in jobs]
+
+
+def prune_clips(episodes):
+    """Delete generated clip files that no episode refers to."""
+    if not CLIPS_DIR.exists():
+        return
+    used = {Path(ep["clip"]["file"]).name for ep in episodes if ep.get("clip")}
+    for path in CLIPS_DIR.iterdir():
+        if CLIP_NAME_RE.fullmatch(path.name) and path.name not in used:
+            path.unlink()
+
+
+def main(jobs=None):
+    with open(METADATA_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    try:
+        changed = cut_clips(data["episodes"], max_workers=jobs or MAX_WORKERS)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if changed:
+        with open(METADATA_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"✓ Clips up to date for {len(data['episodes'])} episode(s), {len(changed)} updated")
+    print(f"  Files in {ROOT / CLIPS_DIR}; commit them with the pages (generate-season2 embeds them)")
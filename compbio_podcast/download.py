@@ -0,0 +1,461 @@
+"""
+Download all audio files from A Coffee with CompBio podcast RSS feed.
+
+Episodes are downloaded a few at a time over one pooled HTTP session.
+Each file is written to `<name>.part` and renamed once its size matches the
+server's Content-Length, so an interrupted run resumes with a Range request
+instead of starting over (or, worse, keeping a truncated file).
+
+With --sync, the feed is fetched with a conditional GET and only new or
+changed episodes are merged into the existing episode_metadata.json, so
+local fields (season, archive_url, locally added episodes) are kept.
+
+Usage:
+    python -m compbio_podcast download [--feed-url URL]          # full mirror
+    python -m compbio_podcast download --sync [--feed-url URL]   # incremental
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from urllib.parse import urlparse
+
+from .paths import METADATA_FILE
+
+# RSS feed URL
+RSS_FEED_URL = "https://feed.ausha.co/Gdv6mfJNJ2M7"
+
+# Episode fields that come from the source feed; everything else in
+# episode_metadata.json is local and never overwritten by a sync
+FEED_FIELDS = ('title', 'description', 'published', 'duration', 'original_audio_url')
+
+# Directory for audio files (created on first download), relative to the
+# repo root so episode_metadata.json gets "audio/..." paths
+AUDIO_DIR = Path("audio")
+
+# Concurrent downloads; also the size of the session's connection pool
+MAX_WORKERS = 4
+CHUNK_SIZE = 1024 * 1024
+# Print the combined progress line at most this often (seconds)
+PROGRESS_INTERVAL = 0.5
+TIMEOUT = (10, 60)
+
+def sanitize_filename(filename):
+    """Remove or replace characters that are problematic in filenames."""
+    invalid_chars = '<>:"/\\|?*'
+    for char in invalid_chars:
+        filename = filename.replace(char, '_')
+    return filename
+
+def episode_filename(url, episode_title, episode_number):
+    """Build the local filename for an episode from its title and URL."""
+    # Get file extension from URL
+    parsed_url = urlparse(url)
+    ext = os.path.splitext(parsed_url.path)[1] or '.mp3'
+    safe_title = sanitize_filename(episode_title)
+    return f"episode_{episode_number:02d}_{safe_title}{ext}"
+
+def create_session(pool_size=MAX_WORKERS):
+    """Create a requests session whose connection pool fits all workers."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=3)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+class Progress:
+    """Combined byte counter for all downloads, printed at a throttled rate."""
+
+    def __init__(self, total_files):
+        self.total_files = total_files
+        self.done_files = 0
+        self.downloaded = 0
+        self._lock = threading.Lock()
+        self._last_print = 0.0
+
+    def add_bytes(self, count):
+        with self._lock:
+            self.downloaded += count
+            now = time.monotonic()
+            if now - self._last_print < PROGRESS_INTERVAL:
+                return
+            self._last_print = now
+        self.show()
+
+    def file_done(self):
+        with self._lock:
+            self.done_files += 1
+
+    def show(self):
+        print(f"\r  Progress: {self.done_files}/{self.total_files} files, "
+              f"{self.downloaded / 1e6:.1f} MB", end='', flush=True)
+
+def remote_size(session, url):
+    """Return the Content-Length reported for url, or None if unknown."""
+    response = session.head(url, allow_redirects=True, timeout=TIMEOUT)
+    if response.ok and response.headers.get('content-length'):
+        return int(response.headers['content-length'])
+    return None
+
+def download_audio_file(session, url, filepath, progress=None):
+    """Download url to filepath, resuming a previous partial download.
+
+    Raises IOError if the server closes the connection before the expected
+    number of bytes arrived; the .part file is kept for the next run. A
+    .part file the server cannot resume (416 with another total size) is
+    deleted and the download restarted.
+    """
+    filepath = Path(filepath)
+    part_path = filepath.with_name(filepath.name + '.part')
+
+    # Skip if already downloaded, unless it is shorter than the remote file
+    # (left behind by older versions of this script)
+    if filepath.exists():
+        size = remote_size(session, url)
+        if size is None or filepath.stat().st_size == size:
+            return filepath, False
+        if filepath.stat().st_size < size and not part_path.exists():
+            os.replace(filepath, part_path)
+
+    offset = part_path.stat().st_size if part_path.exists() else 0
+    headers = {'Range': f'bytes={offset}-'} if offset else {}
+
+    with session.get(url, headers=headers, stream=True, timeout=TIMEOUT) as response:
+        if response.status_code == 416:
+            # Nothing left to fetch: the .part file may already be complete
+            total = response.headers.get('content-range', '').rpartition('/')[2]
+            if total.isdigit() and int(total) == offset:
+                os.replace(part_path, filepath)
+                return filepath, True
+            restart = True
+        else:
+            restart = False
+            response.raise_for_status()
+            expected = write_response(response, part_path, offset, progress)
+
+    if restart:
+        # The .part file is larger than the remote file, or from another
+        # version of it; start over
+        part_path.unlink()
+        return download_audio_file(session, url, filepath, progress)
+
+    written = part_path.stat().st_size
+    if expected is not None and written != expected:
+        raise IOError(f"incomplete download ({written} of {expected} bytes), re-run to resume")
+
+    os.replace(part_path, filepath)
+    return filepath, True
+
+def write_response(response, part_path, offset, progress=None):
+    """Write (or append) a response body to part_path.
+
+    Returns the size part_path should have once the body is complete, or
+    None if the server did not send a Content-Length.
+    """
+    if response.status_code == 206:
+        mode = 'ab'
+    else:
+        # Server ignored the Range header; start over
+        mode, offset = 'wb', 0
+
+    length = response.headers.get('content-length')
+    expected = offset + int(length) if length else None
+    # Keep what did arrive of a cut-off body (urllib3 2 would discard it
+    # and raise); the size check in the caller reports it
+    response.raw.enforce_content_length = False
+
+    with open(part_path, mode) as f:
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            f.write(chunk)
+            if progress:
+                progress.add_bytes(len(chunk))
+    return expected
+
+def download_all(jobs, audio_dir=AUDIO_DIR, session=None, max_workers=MAX_WORKERS):
+    """Download (number, title, url) jobs concurrently.
+
+    Returns a list of dicts describing the files now on disk.
+    """
+    audio_dir = Path(audio_dir)
+    audio_dir.mkdir(exist_ok=True)
+    session = session or create_session(max_workers)
+    progress = Progress(len(jobs))
+
+    downloaded_files = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(
+                download_audio_file, session, url,
+                audio_dir / episode_filename(url, title, number), progress,
+            ): (number, title, url)
+            for number, title, url in jobs
+        }
+        for future in as_completed(futures):
+            number, title, url = futures[future]
+            progress.file_done()
+            try:
+                filepath, fetched = future.result()
+            except Exception as e:
+                print(f"\n  ✗ Error downloading Episode {number}: {title}: {e}")
+                continue
+            status = "Downloaded" if fetched else "Already exists"
+            print(f"\n  ✓ {status}: {filepath.name}")
+            downloaded_files.append({
+                'number': number,
+                'title': title,
+                'filepath': filepath,
+                'original_url': url
+            })
+
+    progress.show()
+    print()
+    return sorted(downloaded_files, key=lambda df: df['number'])
+
+def audio_url_for(entry):
+    """Find the audio enclosure URL of a feed entry."""
+    if hasattr(entry, 'enclosures') and entry.enclosures:
+        return entry.enclosures[0].get('href')
+    if hasattr(entry, 'links'):
+        for link in entry.links:
+            if link.get('type', '').startswith('audio/'):
+                return link.get('href')
+    return None
+
+def entry_guid(entry):
+    """Stable identifier of a feed entry: its <guid>, else enclosure or title."""
+    return entry.get('id') or audio_url_for(entry) or entry.get('title', '')
+
+def entry_fields(entry):
+    """The FEED_FIELDS of a feed entry, in episode_metadata.json form."""
+    return {
+        'title': entry.get('title', ''),
+        'description': entry.get('description', ''),
+        'published': entry.get('published', ''),
+        'duration': entry.get('itunes_duration', ''),
+        'original_audio_url': audio_url_for(entry),
+    }
+
+def fetch_feed(session, url, state):
+    """Fetch the feed with a conditional GET.
+
+    `state` holds the ETag / Last-Modified of the previous fetch. Returns
+    (body, new_state); body is None when the server answered 304.
+    """
+    headers = {}
+    if state.get('url') == url:
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+
+    response = session.get(url, headers=headers, timeout=TIMEOUT)
+    if response.status_code == 304:
+        return None, state
+    response.raise_for_status()
+
+    new_state = {'url': url}
+    if response.headers.get('etag'):
+        new_state['etag'] = response.headers['etag']
+    if response.headers.get('last-modified'):
+        new_state['last_modified'] = response.headers['last-modified']
+    return response.content, new_state
+
+def audio_key(url):
+    """An audio URL without its query string, which Ausha rotates (?t=...)."""
+    return urlparse(url)._replace(query='', fragment='').geturl() if url else url
+
+def merge_feed_entries(metadata, entries):
+    """Merge feed entries into metadata['episodes'] in place, keyed by GUID.
+
+    Existing episodes only get their FEED_FIELDS updated. Episodes synced
+    before GUIDs were recorded are matched by audio URL (ignoring the query
+    string) or title. New entries are prepended in feed order (newest
+    first). Returns (added, updated) lists of episode dicts.
+    """
+    episodes = metadata['episodes']
+    by_guid = {ep['source_guid']: ep for ep in episodes if ep.get('source_guid')}
+    by_url = {audio_key(ep['original_audio_url']): ep for ep in episodes if ep.get('original_audio_url')}
+    by_title = {ep.get('title'): ep for ep in episodes}
+
+    added, updated = [], []
+    for entry in entries:
+        guid = entry_guid(entry)
+        fields = entry_fields(entry)
+        episode = (
+            by_guid.get(guid)
+            or by_url.get(audio_key(fields['original_audio_url']))
+            or by_title.get(fields['title'])
+        )
+
+        if episode is None:
+            season = int(entry['itunes_season']) if entry.get('itunes_season') else None
+            if entry.get('itunes_episode'):
+                number = int(entry['itunes_episode'])
+            else:
+                numbers = [ep.get('number', 0) for ep in episodes + added if ep.get('season') == season]
+                number = max(numbers, default=0) + 1
+            episode = {'season': season, 'number': number, **fields,
+                       'local_file': None, 'archive_url': '', 'source_guid': guid}
+            if season is None:
+                del episode['season']
+            added.append(episode)
+            by_guid[guid] = episode
+            continue
+
+        changes = {k: v for k, v in fields.items() if v and episode.get(k) != v}
+        if ('original_audio_url' in changes
+                and audio_key(changes['original_audio_url']) == audio_key(episode.get('original_audio_url'))):
+            # Only the query string rotated; same file
+            del changes['original_audio_url']
+        if episode.get('source_guid') != guid:
+            episode['source_guid'] = guid
+        if changes:
+            episode.update(changes)
+            updated.append(episode)
+
+    metadata['episodes'][:0] = added
+    return added, updated
+
+def missing_audio(episodes):
+    """Episodes from the source feed whose audio hasn't been downloaded."""
+    return [ep for ep in episodes if ep.get('original_audio_url') and not ep.get('local_file')]
+
+def fetch_missing(episodes, session):
+    """Download the audio of `episodes`, setting local_file on each.
+
+    Returns the episodes whose download failed.
+    """
+    jobs = [(ep['number'], ep['title'], ep['original_audio_url']) for ep in episodes]
+    if not jobs:
+        return []
+    files = {df['original_url']: df['filepath'] for df in download_all(jobs, session=session)}
+    for ep in episodes:
+        if ep['original_audio_url'] in files:
+            ep['local_file'] = str(files[ep['original_audio_url']])
+            ep['length'] = files[ep['original_audio_url']].stat().st_size
+    return missing_audio(episodes)
+
+def sync(feed_url):
+    """Incrementally mirror the feed into episode_metadata.json.
+
+    The feed's ETag / Last-Modified are always recorded; downloads that
+    failed are retried on the next sync even if the feed hasn't changed.
+    """
+    metadata = {'episodes': []}
+    if METADATA_FILE.exists():
+        with open(METADATA_FILE, 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+
+    session = create_session()
+    print(f"Checking RSS feed: {feed_url}")
+    body, state = fetch_feed(session, feed_url, metadata.get('source_feed', {}))
+    added, updated = [], []
+    if body is None:
+        if not missing_audio(metadata['episodes']):
+            print("✓ Feed not modified since last sync, nothing to do")
+            return
+        print("Feed not modified since last sync; retrying failed downloads")
+    else:
+        import feedparser
+
+        feed = feedparser.parse(body)
+        if feed.bozo and not feed.entries:
+            print(f"Error: Could not parse feed: {feed.bozo_exception}")
+            sys.exit(1)
+
+        added, updated = merge_feed_entries(metadata, feed.entries)
+        metadata.setdefault('podcast_title', feed.feed.get('title', 'A Coffee with CompBio'))
+        metadata.setdefault('podcast_description', feed.feed.get('description', ''))
+
+    # Fetch audio for new episodes and for any whose download failed before
+    failed = fetch_missing(missing_audio(metadata['episodes']), session)
+    metadata['source_feed'] = state
+    if failed:
+        print(f"⚠ {len(failed)} download(s) failed; re-run --sync to retry")
+
+    with open(METADATA_FILE, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, indent=2, ensure_ascii=False)
+
+    print(f"✓ Sync complete: {len(added)} new, {len(updated)} updated, "
+          f"{len(metadata['episodes'])} episodes total")
+    for ep in added:
+        print(f"  + {ep['title']}")
+    for ep in updated:
+        print(f"  ~ {ep['title']}")
+
+def mirror(feed_url):
+    """Download every episode and rewrite episode_metadata.json from the feed."""
+    print(f"Fetching RSS feed from: {feed_url}\n")
+
+    # Parse RSS feed
+    import feedparser
+
+    feed = feedparser.parse(feed_url)
+
+    if not feed.entries:
+        print("Error: No episodes found in feed!")
+        sys.exit(1)
+
+    print(f"Found {len(feed.entries)} episodes\n")
+
+    # Download the episodes concurrently
+    jobs = []
+    for idx, entry in enumerate(feed.entries, 1):
+        title = entry.get('title', f'Episode {idx}')
+        audio_url = audio_url_for(entry)
+        if audio_url:
+            jobs.append((idx, title, audio_url))
+        else:
+            print(f"⚠ No audio URL found for: {title}")
+
+    downloaded_files = download_all(jobs)
+
+    # Print summary
+    print("=" * 60)
+    print(f"Download complete! {len(downloaded_files)}/{len(feed.entries)} episodes downloaded")
+    print(f"Audio files saved in: {AUDIO_DIR.absolute()}")
+    print("=" * 60)
+
+    # Save metadata
+    metadata_file = METADATA_FILE
+    metadata = {
+        'podcast_title': feed.feed.get('title', 'A Coffee with CompBio'),
+        'podcast_description': feed.feed.get('description', ''),
+        'episodes': []
+    }
+
+    for idx, entry in enumerate(feed.entries, 1):
+        episode_data = {
+            'number': idx,
+            'title': entry.get('title', ''),
+            'description': entry.get('description', ''),
+            'published': entry.get('published', ''),
+            'duration': entry.get('itunes_duration', ''),
+            'original_audio_url': None,
+            'local_file': None
+        }
+
+        # Find audio URL
+        if hasattr(entry, 'enclosures') and entry.enclosures:
+            episode_data['original_audio_url'] = entry.enclosures[0].get('href')
+
+        # Find matching downloaded file
+        for df in downloaded_files:
+            if df['number'] == idx:
+                episode_data['local_file'] = str(df['filepath'])
+                episode_data['length'] = df['filepath'].stat().st_size
+                break
+
+        metadata['episodes'].append(episode_data)
+
+    with open(metadata_file, 'w') as f:
+        json.dump(metadata, f, indent=2)
+
+    print(f"\nMetadata saved to: {metadata_file.absolute()}")
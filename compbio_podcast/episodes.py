@@ -0,0 +1,249 @@
+"""
+Typed, compact in-memory model of episode_metadata.json.
+
+The generators used to walk the metadata as raw dicts and re-derive the
+same things per episode (plain-text summary, subtitle, GUID, parsed date).
+`load_catalog()` reads the file once — with orjson when it is installed —
+validates every episode and parses its pubDate, and each derived field is
+computed on first use and then kept on the episode, so it is built at most
+once per build however many generators read it.
+
+Writers (parse-episode, upload, download) still edit the raw dicts so the
+JSON file keeps its exact layout; `Catalog.from_dict()` turns such a dict
+into the model.
+
+Episodes written by parse-episode store their show notes as markdown plus a
+shared footer (see show_notes.py); `description_html` renders them on first
+use. Older episodes keep their HTML in `description`.
+"""
+
+import hashlib
+import json
+import re
+
+from .paths import METADATA_FILE
+from .show_notes import description_html
+from .tracing import span
+
+AUSHA_FOOTER = 'Hosted on Ausha. See ausha.co/privacy-policy for more information.'
+
+SUBTITLE_CHARS = 125
+SUMMARY_CHARS = 200
+
+# Keys with a slot of their own; anything else round-trips through `extra`
+FIELDS = (
+    "season", "number", "title", "description", "published", "duration",
+    "original_audio_url", "local_file", "archive_url",
+)
+
+
+def _json_loads():
+    """orjson.loads if available, else the standard library parser."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+class Episode:
+    """One episode. Derived text fields are computed lazily and memoized."""
+
+    __slots__ = FIELDS + (
+        "published_at", "extra", "blocks",
+        "_description_html", "_feed_description", "_plain_text", "_summary", "_subtitle", "_guid",
+    )
+
+    def __init__(self, title, number, published, published_at, season=None,
+                 description="", duration="", original_audio_url=None,
+                 local_file=None, archive_url="", extra=None, blocks=None):
+        self.season = season
+        self.number = number
+        self.title = title
+        self.description = description
+        self.published = published
+        self.published_at = published_at
+        self.duration = duration
+        self.original_audio_url = original_audio_url
+        self.local_file = local_file
+        self.archive_url = archive_url
+        self.extra = extra or {}
+        self.blocks = blocks or {}
+        self._description_html = None
+        self._feed_description = None
+        self._plain_text = None
+        self._summary = None
+        self._subtitle = None
+        self._guid = None
+
+    @classmethod
+    def from_dict(cls, data, blocks=None):
+        """Build an Episode from its metadata dict. Raises ValueError if invalid.
+
+        `blocks` are the catalog's shared show-notes blocks, by name.
+        """
+        title = data.get("title")
+        if not isinstance(title, str) or not title:
+            raise ValueError("missing title")
+        number = data.get("number")
+        if not isinstance(number, int):
+            raise ValueError(f"{title!r}: episode number must be an integer, got {number!r}")
+        season = data.get("season")
+        if season is not None and not isinstance(season, int):
+            raise ValueError(f"{title!r}: season must be an integer, got {season!r}")
+        # Imported here, not at the top: email.utils loads socket and calendar
+        from email.utils import parsedate_to_datetime
+
+        published = data.get("published") or ""
+        try:
+            published_at = parsedate_to_datetime(published)
+        except (TypeError, ValueError):
+            raise ValueError(f"{title!r}: invalid published date {published!r}") from None
+        footer = data.get("footer")
+        if footer and footer not in (blocks or {}):
+            raise ValueError(f"{title!r}: unknown shared block {footer!r}")
+
+        return cls(
+            title=title,
+            number=number,
+            published=published,
+            published_at=published_at,
+            season=season,
+            description=data.get("description") or "",
+            duration=data.get("duration") or "",
+            original_audio_url=data.get("original_audio_url"),
+            local_file=data.get("local_file"),
+            archive_url=data.get("archive_url") or "",
+            extra={k: v for k, v in data.items() if k not in FIELDS},
+            blocks=blocks,
+        )
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in FIELDS}
+        data.update(self.extra)
+        return data
+
+    @property
+    def guid(self):
+        """Stable feed GUID: SHA-1 of the title."""
+        if self._guid is None:
+            self._guid = hashlib.sha1(self.title.encode()).hexdigest()
+        return self._guid
+
+    @property
+    def description_html(self):
+        """Show notes as HTML: rendered from the markdown source, or the stored HTML."""
+        if self._description_html is None:
+            self._description_html = description_html(self.to_dict(), self.blocks)
+        return self._description_html
+
+    @property
+    def feed_description(self):
+        """Description HTML without the old Ausha hosting footer."""
+        if self._feed_description is None:
+            self._feed_description = strip_ausha_footer(self.description_html)
+        return self._feed_description
+
+    @property
+    def plain_text(self):
+        """Feed description with tags stripped and whitespace collapsed.
+
+        HTML entities are kept, so the text is still safe to embed in HTML.
+        """
+        if self._plain_text is None:
+            text = re.sub(r"<[^>]+>", " ", self.feed_description)
+            self._plain_text = re.sub(r"\s+", " ", text).strip()
+        return self._plain_text
+
+    @property
+    def summary(self):
+        """Plain-text description cut at a word boundary for the season pages."""
+        if self._summary is None:
+            text = self.plain_text
+            if len(text) > SUMMARY_CHARS:
+                text = text[:SUMMARY_CHARS].rsplit(" ", 1)[0] + "…"
+            self._summary = text
+        return self._summary
+
+    @property
+    def subtitle(self):
+        """First 125 characters of the feed description without tags."""
+        if self._subtitle is None:
+            text = re.sub('<[^<]+?>', '', self.feed_description)
+            self._subtitle = text[:SUBTITLE_CHARS] + '...' if len(text) > SUBTITLE_CHARS else text
+        return self._subtitle
+
+    @property
+    def length(self):
+        """Size of the audio file in bytes, recorded by parse-episode, upload
+        and download --sync for when the file isn't local (0 if unknown)."""
+        return self.extra.get("length", 0)
+
+    @property
+    def renditions(self):
+        """Low-bitrate renditions recorded by `transcode` (see renditions.py)."""
+        return self.extra.get("renditions", [])
+
+    @property
+    def clip(self):
+        """Preview clip recorded by `clips` (see clips.py), or None."""
+        return self.extra.get("clip")
+
+    @property
+    def display_date(self):
+        """'Mon, 27 Jan 2026 12:00:00 +0000' → 'Jan 27, 2026'."""
+        return self.published_at.strftime("%b %d, %Y")
+
+    def __repr__(self):
+        return f"<Episode S{self.season or 0:02d}E{self.number:02d} {self.title!r}>"
+
+
+class Catalog:
+    """The podcast description plus its validated episodes, in file order."""
+
+    __slots__ = ("podcast_title", "podcast_description", "episodes", "extra")
+
+    def __init__(self, episodes, podcast_title="", podcast_description="", extra=None):
+        self.episodes = episodes
+        self.podcast_title = podcast_title
+        self.podcast_description = podcast_description
+        self.extra = extra or {}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Validate a parsed metadata dict. Raises ValueError listing every bad episode."""
+        episodes, errors = [], []
+        blocks = data.get("blocks", {})
+        for index, item in enumerate(data.get("episodes", [])):
+            try:
+                episodes.append(Episode.from_dict(item, blocks))
+            except ValueError as e:
+                errors.append(f"episode #{index + 1}: {e}")
+        if errors:
+            raise ValueError("Invalid episode metadata:\n  " + "\n  ".join(errors))
+        return cls(
+            episodes,
+            podcast_title=data.get("podcast_title", ""),
+            podcast_description=data.get("podcast_description", ""),
+            extra={k: v for k, v in data.items()
+                   if k not in ("episodes", "podcast_title", "podcast_description")},
+        )
+
+    def season(self, number):
+        """Episodes of one season, in file order."""
+        return [ep for ep in self.episodes if ep.season == number]
+
+
+def strip_ausha_footer(text):
+    """Remove the "Hosted on Ausha" message left over from the old host."""
+    if not text:
+        return ""
+    return text.replace(AUSHA_FOOTER, '').strip()
+
+
+def load_catalog(path=METADATA_FILE):
+    """Read and validate episode_metadata.json. Raises ValueError if invalid."""
+    with span("load", path=str(path)) as s:
+        raw = path.read_bytes()
+        s.add_bytes(len(raw))
+        return Catalog.from_dict(_json_loads()(raw))
@@ -0,0 +1,82 @@
+"""
+Render feed.html by applying rss.xslt to feed.xml at build time.
+
+Browsers otherwise download the whole feed plus the stylesheet and run the
+XSLT transform themselves, which is slow on mobile and unsupported in some
+browsers. Podcast apps keep using feed.xml.
+
+feed.html is only rewritten when the hash of feed.xml or rss.xslt changes.
+
+Usage:
+    python -m compbio_podcast render-feed [--force] [--minify]
+    # or:
+    pixi run render-feed
+"""
+
+import hashlib
+import re
+
+from .paths import ROOT
+from .tracing import span
+
+FEED_FILE = ROOT / "feed.xml"
+XSLT_FILE = ROOT / "rss.xslt"
+OUTPUT_FILE = ROOT / "feed.html"
+
+# Written as the last line of feed.html so the next build can skip the transform
+HASH_MARKER = "<!-- source-sha256: {} -->"
+HASH_PATTERN = re.compile(r"<!-- source-sha256: ([0-9a-f]{64}) -->\s*$")
+
+
+def source_hash(minify=False):
+    """Hash feed.xml and rss.xslt together (and whether to minify)."""
+    digest = hashlib.sha256(b"minify" if minify else b"")
+    with span("hash", output=OUTPUT_FILE.name) as s:
+        for path in (FEED_FILE, XSLT_FILE):
+            data = path.read_bytes()
+            digest.update(data)
+            s.add_bytes(len(data))
+    return digest.hexdigest()
+
+
+def rendered_hash():
+    """Return the source hash recorded in the current feed.html, if any."""
+    if not OUTPUT_FILE.exists():
+        return None
+    with open(OUTPUT_FILE, "rb") as f:
+        # The marker is the last line; no need to read the whole page
+        f.seek(0, 2)
+        f.seek(max(f.tell() - 200, 0))
+        tail = f.read().decode("utf-8", errors="replace")
+    match = HASH_PATTERN.search(tail)
+    return match.group(1) if match else None
+
+
+def transform():
+    """Apply rss.xslt to feed.xml and return the HTML as a string."""
+    from lxml import etree
+
+    xslt = etree.XSLT(etree.parse(str(XSLT_FILE)))
+    result = xslt(etree.parse(str(FEED_FILE)))
+    return str(result)
+
+
+def render_feed_html(force=False, minify=False):
+    """Regenerate feed.html if its inputs changed. Returns True if written."""
+    digest = source_hash(minify)
+    if not force and rendered_hash() == digest:
+        print(f"✓ {OUTPUT_FILE.name} is up to date")
+        return False
+
+    with span("render", output=OUTPUT_FILE.name) as s:
+        html = transform()
+        s.add_bytes(len(html.encode("utf-8")))
+    if minify:
+        from .minify import minify as minify_text
+        html = minify_text(OUTPUT_FILE.name, html, "html")
+    with span("write", path=str(OUTPUT_FILE)) as s:
+        data = (html.rstrip() + "\n" + HASH_MARKER.format(digest) + "\n").encode("utf-8")
+        OUTPUT_FILE.write_bytes(data)
+        s.add_bytes(len(data))
+    print(f"✓ Rendered {OUTPUT_FILE.name} from {FEED_FILE.name} + {XSLT_FILE.name}")
+    return True
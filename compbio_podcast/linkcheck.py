@@ -0,0 +1,177 @@
+"""
+Check the links in the episode show notes.
+
+Every href in the episode descriptions is collected and de-duplicated, then
+checked concurrently: an asyncio loop hands the requests to a thread pool
+sharing one pooled requests session, with at most PER_HOST requests to
+any one host at a time. Each link gets a HEAD request, and a GET when the
+server doesn't answer HEAD properly or the HEAD request fails.
+
+Results are cached in .linkcheck-cache.json. A working link is re-checked
+after CACHE_TTL and a failed one after FAILURE_TTL, so repeated runs only
+touch stale entries. Hosts that block bots (HTTP 429/999, e.g. LinkedIn)
+are reported as unverified, not broken.
+
+Usage:
+    python -m compbio_podcast check-links [--refresh] [URL ...]
+    # or:
+    pixi run check-links
+"""
+
+import json
+import re
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from .paths import ROOT
+from .tracing import span
+
+CACHE_FILE = ROOT / ".linkcheck-cache.json"
+
+MAX_WORKERS = 16
+PER_HOST = 2
+TIMEOUT = 10            # seconds per request
+CACHE_TTL = 7 * 24 * 3600
+FAILURE_TTL = 3600
+
+USER_AGENT = "Mozilla/5.0 (compatible; compbio-podcast-linkcheck)"
+
+# Status codes meaning "the server refused to tell us", not "the link is dead"
+BLOCKED_STATUSES = {429, 999}
+# HEAD answered with one of these: try again with GET
+HEAD_UNSUPPORTED = {403, 404, 405, 501}
+
+HREF_RE = re.compile(r'href="(https?://[^"]+)"')
+
+
+def extract_links(catalog):
+    """Map each http(s) URL in the descriptions → titles of the episodes linking it."""
+    links = defaultdict(list)
+    for episode in catalog.episodes:
+        for url in HREF_RE.findall(episode.description_html):
+            url = url.replace("&amp;", "&")
+            if episode.title not in links[url]:
+                links[url].append(episode.title)
+    return links
+
+
+def create_session(pool_size=MAX_WORKERS):
+    """A requests session pooling PER_HOST connections for many hosts, no retries."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.headers["User-Agent"] = USER_AGENT
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=PER_HOST, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def check_url(session, url, timeout=TIMEOUT):
+    """Check one URL. Returns a result dict: status, state and error."""
+    import requests
+
+    status, error = None, None
+    try:
+        response = session.head(url, allow_redirects=True, timeout=timeout)
+        status = response.status_code
+    except requests.RequestException as e:
+        # Some servers drop HEAD requests; let the GET decide
+        error = f"{type(e).__name__}: {e}"
+    if status is None or status in HEAD_UNSUPPORTED or status >= 500:
+        try:
+            with session.get(url, allow_redirects=True, timeout=timeout, stream=True) as response:
+                status, error = response.status_code, None
+        except requests.RequestException as e:
+            error = f"{type(e).__name__}: {e}"
+
+    if status in BLOCKED_STATUSES:
+        state = "blocked"
+    elif status is not None and status < 400:
+        state = "ok"
+    else:
+        state = "broken"
+    return {"status": status, "state": state, "error": error, "checked": time.time()}
+
+
+def is_fresh(result, now):
+    ttl = CACHE_TTL if result["state"] == "ok" else FAILURE_TTL
+    return now - result["checked"] < ttl
+
+
+async def check_all(urls, session, max_workers=MAX_WORKERS, timeout=TIMEOUT):
+    """Check `urls` concurrently; returns {url: result}."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    host_limits = defaultdict(lambda: asyncio.Semaphore(PER_HOST))
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        async def check(url):
+            async with host_limits[urlparse(url).netloc]:
+                results[url] = await loop.run_in_executor(pool, check_url, session, url, timeout)
+
+        await asyncio.gather(*(check(url) for url in urls))
+    return results
+
+
+def load_cache():
+    try:
+        return json.loads(CACHE_FILE.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def check_links(urls, refresh=False, max_workers=MAX_WORKERS, timeout=TIMEOUT):
+    """Check `urls`, reusing fresh cached results unless `refresh`.
+
+    Returns ({url: result} for every URL, number of URLs actually checked)
+    and updates the cache file.
+    """
+    cache = load_cache()
+    now = time.time()
+    stale = [url for url in urls if refresh or url not in cache or not is_fresh(cache[url], now)]
+
+    if stale:
+        import asyncio
+
+        session = create_session(max_workers)
+        with span("check", links=len(stale)), session:
+            cache.update(asyncio.run(check_all(stale, session, max_workers, timeout)))
+        CACHE_FILE.write_text(json.dumps(cache, indent=1, sort_keys=True))
+    return {url: cache[url] for url in urls}, len(stale)
+
+
+def main(urls=None, refresh=False, jobs=None):
+    """Check the given URLs, or every link in episode_metadata.json. Exits 1 on broken links."""
+    if urls:
+        links = {url: [] for url in urls}
+    else:
+        from .episodes import load_catalog
+        links = extract_links(load_catalog())
+
+    started = time.perf_counter()
+    results, checked = check_links(list(links), refresh=refresh, max_workers=jobs or MAX_WORKERS)
+    elapsed = time.perf_counter() - started
+    print(f"Checked {checked} of {len(results)} link(s) in {elapsed:.1f}s "
+          f"({len(results) - checked} fresh in {CACHE_FILE.name})")
+
+    broken = {url: r for url, r in results.items() if r["state"] == "broken"}
+    blocked = [url for url, r in results.items() if r["state"] == "blocked"]
+    if blocked:
+        print(f"\n⚠ {len(blocked)} link(s) could not be verified (host blocks bots):")
+        for url in sorted(blocked):
+            print(f"  {url}")
+    if broken:
+        print(f"\n❌ {len(broken)} broken link(s):")
+        for url, result in sorted(broken.items()):
+            print(f"  {url} → {result['status'] or result['error']}")
+            for title in links[url]:
+                print(f"      in: {title}")
+        sys.exit(1)
+    print("✓ No broken links")
@@ -0,0 +1,69 @@
+"""
+Strip insignificant whitespace from the generated XML and HTML.
+
+The generators write nicely indented output; with --minify they pass it
+through here before writing. CDATA sections are never touched, and neither
+are <pre>, <textarea> and <script> blocks in HTML.
+
+- XML: whitespace-only text between tags is dropped and whitespace inside
+  tags is collapsed to one space.
+- HTML: any whitespace run containing a newline (i.e. indentation) becomes
+  a single newline. That renders the same as before, whereas a space between
+  inline elements can be significant. Whitespace inside tags is collapsed
+  as for XML.
+"""
+
+import re
+
+from .tracing import span
+
+CDATA_RE = re.compile(r"(<!\[CDATA\[.*?\]\]>)", re.S)
+HTML_KEEP_RE = re.compile(r"(<!\[CDATA\[.*?\]\]>|<(pre|textarea|script)\b.*?</\2\s*>)", re.S | re.I)
+TAG_RE = re.compile(r"<[^>]+>")
+BETWEEN_TAGS_RE = re.compile(r">\s+<")
+INDENT_RE = re.compile(r"[ \t]*\n\s*")
+
+
+def _collapse_tag(match):
+    tag = re.sub(r"\s+", " ", match.group())
+    return tag.replace(" />", "/>").replace(" >", ">")
+
+
+def minify_xml(text):
+    parts = CDATA_RE.split(text)
+    # Even indexes are outside CDATA
+    for i in range(0, len(parts), 2):
+        part = BETWEEN_TAGS_RE.sub("><", parts[i])
+        parts[i] = TAG_RE.sub(_collapse_tag, part)
+    return "".join(parts).strip() + "\n"
+
+
+def minify_html(text):
+    pieces = []
+    last = 0
+    for match in HTML_KEEP_RE.finditer(text):
+        pieces.append(_minify_html_text(text[last:match.start()]))
+        pieces.append(match.group())
+        last = match.end()
+    pieces.append(_minify_html_text(text[last:]))
+    return "".join(pieces).strip() + "\n"
+
+
+def _minify_html_text(text):
+    return TAG_RE.sub(_collapse_tag, INDENT_RE.sub("\n", text))
+
+
+MINIFIERS = {"xml": minify_xml, "html": minify_html}
+
+
+def minify(name, text, kind):
+    """Minify `text` (kind "xml" or "html") and report the bytes saved."""
+    with span("minify", output=name) as s:
+        before = len(text.encode("utf-8"))
+        text = MINIFIERS[kind](text)
+        after = len(text.encode("utf-8"))
+        s.add_bytes(before)
+    saved = before - after
+    print(f"  Minified {name}: {before:,} → {after:,} bytes "
+          f"(saved {saved:,}, {saved / before:.0%})" if before else f"  Minified {name}: empty")
+    return text
@@ -0,0 +1,242 @@
+"""
+Parse an episode markdown file and add it to episode_metadata.json.
+
+Usage:
+    python -m compbio_podcast parse-episode episodes_markdown/S02E02.md
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+from .paths import METADATA_FILE, ROOT
+from .show_notes import store_footer
+from .tracing import span
+
+
+def parse_sections(md_text):
+    """Split markdown into named sections (## Heading → content)."""
+    sections = {}
+    current_section = None
+    lines = []
+
+    for line in md_text.splitlines():
+        heading = re.match(r"^## (.+)", line)
+        if heading:
+            if current_section is not None:
+                sections[current_section] = "\n".join(lines).strip()
+            current_section = heading.group(1).strip()
+            lines = []
+        elif line.strip() == "---":
+            continue
+        else:
+            if current_section is not None:
+                lines.append(line)
+
+    if current_section is not None:
+        sections[current_section] = "\n".join(lines).strip()
+
+    return sections
+
+
+def parse_metadata(metadata_text):
+    """Extract key-value pairs from the Metadata section."""
+    result = {}
+    for line in metadata_text.splitlines():
+        m = re.match(r"^-\s+\*\*(.+?):\*\*\s*(.+)", line)
+        if m:
+            result[m.group(1).strip()] = m.group(2).strip()
+    return result
+
+
+# Fields an edit of the markdown may change in an existing entry
+SHOW_NOTES_FIELDS = ("title", "description_md", "links_md", "footer")
+# Only taken from the markdown when they point at audio that is here
+AUDIO_FIELDS = ("local_file", "duration", "length")
+
+
+def merge_episode(data, episode, replace=False):
+    """Prepend new episode entry to data["episodes"].
+
+    With replace=True an existing entry for the same season + episode is
+    updated in place instead (see update_entry). Returns "Added", "Updated",
+    or None if nothing changed. Raises ValueError for a duplicate when
+    replace is False.
+
+    The episode's footer goes to the shared data["blocks"] (see show_notes.py).
+    """
+    store_footer(data, episode)
+    # Check for duplicate (same season + episode number)
+    for index, existing in enumerate(data["episodes"]):
+        if existing.get("season") == episode["season"] and existing.get("number") == episode["number"]:
+            if not replace:
+                raise ValueError(f"Season {episode['season']} Episode {episode['number']} already exists in metadata.")
+            merged = update_entry(existing, episode)
+            if merged == existing:
+                return None
+            data["episodes"][index] = merged
+            prune_blocks(data)
+            return "Updated"
+
+    data["episodes"].insert(0, episode)
+    return "Added"
+
+
+def update_entry(existing, episode):
+    """The stored entry `existing` updated from a re-parsed `episode`.
+
+    Only the show notes are replaced. The audio file and duration change
+    only when the markdown names different values and the audio is here to
+    confirm them; other differences (e.g. a stored file renamed on upload)
+    are reported and the stored values kept. Fields filled in by later
+    steps, like archive_url, are never touched.
+    """
+    merged = dict(existing)
+    merged.update({k: v for k, v in episode.items() if k in SHOW_NOTES_FIELDS or k not in existing})
+    if "description_md" in merged:
+        # Rendered from the source now; drop the HTML stored before
+        merged.pop("description", None)
+
+    code = f"S{episode['season']:02d}E{episode['number']:02d}"
+    changed = [k for k in AUDIO_FIELDS if episode.get(k) and episode[k] != existing.get(k)]
+    if changed and (ROOT / episode["local_file"]).exists():
+        merged.update({k: episode[k] for k in AUDIO_FIELDS if k in episode})
+        changed = []
+    for key in changed + [k for k in episode if k not in SHOW_NOTES_FIELDS + AUDIO_FIELDS
+                          and episode[k] and k in existing and episode[k] != existing[k]]:
+        print(f"WARNING: {code} {key} is {episode[key]!r} in the markdown but {existing[key]!r} "
+              f"in episode_metadata.json; keeping {existing[key]!r}")
+    return merged
+
+
+def prune_blocks(data):
+    """Drop shared blocks no episode refers to any more."""
+    if "blocks" in data:
+        used = {ep.get("footer") for ep in data["episodes"]}
+        data["blocks"] = {key: text for key, text in data["blocks"].items() if key in used}
+
+
+def update_metadata_file(episode, replace=False):
+    """Merge an episode into episode_metadata.json (see merge_episode).
+
+    Returns True if the file was rewritten.
+    """
+    with open(METADATA_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    try:
+        action = merge_episode(data, episode, replace=replace)
+    except ValueError as e:
+        print(f"WARNING: {e}")
+        print("Aborting to avoid duplicate. Remove the existing entry first if you want to replace it.")
+        sys.exit(1)
+    if action is None:
+        return False
+
+    with open(METADATA_FILE, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+    print(f"{action} S{episode['season']:02d}E{episode['number']:02d}: {episode['title']}")
+    print(f"episode_metadata.json updated ({len(data['episodes'])} episodes total)")
+    return True
+
+
+def read_duration(local_file, typed=None):
+    """Duration read from the audio file's headers.
+
+    The Duration typed in the markdown is only used when the audio file
+    isn't available (or can't be read); a mismatch is reported.
+    """
+    audio_path = ROOT / local_file
+    if not audio_path.exists():
+        return typed
+    from .audio_info import format_duration, probe_cached
+
+    try:
+        info = probe_cached(audio_path)
+    except ValueError as e:
+        print(f"WARNING: Could not read {local_file}: {e}")
+        return typed
+    duration = format_duration(info.duration)
+    if typed and typed != duration:
+        print(f"WARNING: Duration is {typed} in the markdown but {duration} in {local_file}; using {duration}")
+    return duration
+
+
+def parse_episode_file(md_path):
+    """Parse an episode markdown file into an episode_metadata.json entry.
+
+    Raises ValueError if required sections or metadata fields are missing.
+    """
+    with span("load", path=str(md_path)) as s:
+        md_text = Path(md_path).read_text(encoding="utf-8")
+        s.add_bytes(len(md_text))
+    with span("parse", path=str(md_path)):
+        sections = parse_sections(md_text)
+
+    required = {"Metadata", "Description", "Links", "Footer"}
+    missing = required - sections.keys()
+    if missing:
+        raise ValueError(f"Missing sections in markdown: {', '.join(sorted(missing))}")
+
+    meta = parse_metadata(sections["Metadata"])
+
+    required_fields = {"Season", "Episode", "Title", "Published", "Audio File"}
+    missing_fields = required_fields - meta.keys()
+    if missing_fields:
+        raise ValueError(f"Missing metadata fields: {', '.join(sorted(missing_fields))}")
+
+    local_file = f"audio/{meta['Audio File']}"
+    duration = read_duration(local_file, meta.get("Duration"))
+    if not duration:
+        raise ValueError(f"Missing metadata field: Duration (and {local_file} not found to read it from)")
+
+    episode = {
+        "season": int(meta["Season"]),
+        "number": int(meta["Episode"]),
+        "title": meta["Title"],
+        "description_md": sections["Description"],
+        "links_md": sections["Links"],
+        "footer_md": sections["Footer"],
+        "published": meta["Published"],
+        "duration": duration,
+        "original_audio_url": "",
+        "local_file": local_file,
+        "archive_url": "",
+    }
+    # The feed's enclosure length, kept for builds without the audio
+    if (ROOT / local_file).exists():
+        episode["length"] = (ROOT / local_file).stat().st_size
+    return episode
+
+
+def main(md_path):
+    md_path = Path(md_path)
+    if not md_path.exists():
+        print(f"Error: File not found: {md_path}")
+        sys.exit(1)
+
+    try:
+        episode = parse_episode_file(md_path)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    print(f"\nParsed episode:")
+    print(f"  Season:    {episode['season']}")
+    print(f"  Episode:   {episode['number']}")
+    print(f"  Title:     {episode['title']}")
+    print(f"  Published: {episode['published']}")
+    print(f"  Duration:  {episode['duration']}")
+    print(f"  Audio:     {episode['local_file']}")
+    if Path(episode["local_file"]).exists():
+        from .audio_info import probe_cached
+        try:
+            info = probe_cached(episode["local_file"])
+            print(f"             {info.container}, {info.bitrate // 1000} kbps, {info.sample_rate} Hz")
+        except ValueError:
+            pass
+    print()
+
+    update_metadata_file(episode)
@@ -0,0 +1,8 @@
+"""Locations of the repository's data files."""
+
+from pathlib import Path
+
+# Repository root: episode_metadata.json, feed.xml, the pages and audio/ live here
+ROOT = Path(__file__).resolve().parent.parent
+
+METADATA_FILE = ROOT / "episode_metadata.json"
@@ -0,0 +1,503 @@
+"""
+Local HTTP server to preview the RSS feed and website.
+Run this and open http://localhost:8000/feed.xml in your browser.
+
+Behaves like a real static host so podcast clients can be tested locally:
+- one thread per connection, so a slow audio download doesn't block the page
+- ETag / Last-Modified with 304 Not Modified responses
+- gzip for XML/HTML/CSS (uses a fresh `<file>.gz` next to the file if present)
+- byte-range requests, so players can seek within audio/
+- per-request latency in the log
+
+With --watch it also rebuilds the outputs that depend on an edited input
+(episode markdown, episode_metadata.json, rss.xslt, rss-styles.css) and
+tells open browser tabs to reload.
+
+Usage:
+    python -m compbio_podcast preview [--port 8000] [--watch]
+"""
+
+import email.utils
+import gzip
+import http.server
+import os
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+
+from .paths import ROOT
+
+PORT = 8000
+
+# Text types worth compressing; everything else (audio, images) is sent as-is
+COMPRESSIBLE_TYPES = {
+    'application/xml',
+    'application/xslt+xml',
+    'application/rss+xml',
+    'application/json',
+    'application/javascript',
+    'text/xml',
+    'text/html',
+    'text/css',
+    'text/plain',
+}
+
+# Files smaller than this aren't worth the gzip overhead
+MIN_COMPRESS_SIZE = 512
+
+COPY_BUFSIZE = 256 * 1024
+
+# Watch mode: poll every WATCH_INTERVAL seconds and rebuild once inputs have
+# been quiet for WATCH_DEBOUNCE seconds (editors often write a file twice)
+WATCH_INTERVAL = 0.1
+WATCH_DEBOUNCE = 0.15
+
+# Inputs outside episodes_markdown/ and the outputs generated from them.
+# rss-styles.css is only linked from the pages, so it just needs a reload.
+DEPENDENCIES = {
+    'episode_metadata.json': ['feed.xml', 'season2.html'],
+    'download_stats.json': ['season2.html'],
+    'rss.xslt': ['feed.html'],
+    'rss-styles.css': [],
+}
+
+# Outputs that are themselves inputs of another output
+DERIVED_OUTPUTS = {
+    'feed.xml': ['feed.html'],
+}
+
+RELOAD_PATH = '/__reload'
+# Injected before </body> of pages and of rss.xslt (which renders feed.xml),
+# so it must stay valid XML: no '<' or '&' inside the script
+RELOAD_SNIPPET = (b'<script>new EventSource("' + RELOAD_PATH.encode()
+                  + b'").onmessage = function () { location.reload(); };</script>')
+RELOAD_TYPES = {'text/html', 'application/xslt+xml'}
+
+
+class PreviewRequestHandler(http.server.SimpleHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    extensions_map = {
+        **http.server.SimpleHTTPRequestHandler.extensions_map,
+        '.xml': 'application/xml',
+        '.xslt': 'application/xslt+xml',
+        '.xsl': 'application/xslt+xml',
+        '.m4a': 'audio/mp4',
+        '.mp3': 'audio/mpeg',
+        '.opus': 'audio/ogg',
+    }
+
+    # (path, mtime_ns, size) -> gzipped bytes, shared by all handler threads
+    _gzip_cache = {}
+    _gzip_lock = threading.Lock()
+
+    def end_headers(self):
+        # Add CORS headers for local testing
+        self.send_header('Access-Control-Allow-Origin', '*')
+        super().end_headers()
+
+    # -- request timing ----------------------------------------------------
+
+    def handle_one_request(self):
+        self._started = time.perf_counter()
+        self._status = None
+        self._bytes_sent = 0
+        super().handle_one_request()
+        if self._status is not None:
+            elapsed_ms = (time.perf_counter() - self._started) * 1000
+            self.log_message('"%s" %s %dB %.1fms',
+                             self.requestline, self._status, self._bytes_sent, elapsed_ms)
+
+    def log_request(self, code='-', size='-'):
+        # Logged once the response is complete, with latency (see above)
+        self._status = getattr(code, 'value', code)
+
+    # -- serving files -----------------------------------------------------
+
+    def do_GET(self):
+        if self.path == RELOAD_PATH and self.server.reloader is not None:
+            self.stream_reload_events()
+            return
+        source, remaining = self.send_head()
+        if source is None:
+            return
+        try:
+            self.copy_range(source, remaining)
+        finally:
+            source.close()
+
+    def do_HEAD(self):
+        source, _ = self.send_head()
+        if source is not None:
+            source.close()
+
+    def send_head(self):
+        """Send response headers; return (file object, bytes to copy)."""
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) and urllib.parse.urlsplit(self.path).path.endswith('/'):
+            # Serve the directory's index page like any other page
+            for index in ('index.html', 'index.htm'):
+                index_path = os.path.join(path, index)
+                if os.path.isfile(index_path):
+                    path = index_path
+                    break
+        if os.path.isdir(path) or not os.path.isfile(path):
+            # Directory listings, trailing-slash redirects and 404s
+            source = super().send_head()
+            if source is None:
+                return None, 0
+            return source, None
+
+        ctype = self.guess_type(path)
+        st = os.stat(path)
+        last_modified = email.utils.formatdate(st.st_mtime, usegmt=True)
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+        use_gzip = (
+            ctype.split(';')[0] in COMPRESSIBLE_TYPES
+            and st.st_size >= MIN_COMPRESS_SIZE
+            and 'gzip' in self.headers.get('Accept-Encoding', '')
+        )
+        inject_reload = self.server.reloader is not None and ctype.split(';')[0] in RELOAD_TYPES
+        if inject_reload:
+            etag = etag[:-1] + '-lr"'
+        if use_gzip:
+            etag = etag[:-1] + '-gz"'
+
+        if self.not_modified(etag, st.st_mtime):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', last_modified)
+            self.end_headers()
+            return None, 0
+
+        if use_gzip or inject_reload:
+            if inject_reload:
+                body = self.with_reload_snippet(path)
+                if use_gzip:
+                    body = gzip.compress(body, compresslevel=6)
+            else:
+                body = self.gzipped(path, st)
+            self.send_response(200)
+            self.send_header('Content-Type', ctype)
+            if use_gzip:
+                self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('ETag', etag)
+            self.send_header('Last-Modified', last_modified)
+            self.end_headers()
+            return _BytesSource(body), len(body)
+
+        start, end = 0, st.st_size - 1
+        byte_range = self.requested_range(st.st_size, etag, st.st_mtime)
+        if byte_range == 'unsatisfiable':
+            self.send_response(416)
+            self.send_header('Content-Range', f'bytes */{st.st_size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return None, 0
+
+        f = open(path, 'rb')
+        if byte_range:
+            start, end = byte_range
+            f.seek(start)
+            self.send_response(206)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{st.st_size}')
+        else:
+            self.send_response(200)
+        self.send_header('Content-Type', ctype)
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(end - start + 1))
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', last_modified)
+        self.end_headers()
+        return f, end - start + 1
+
+    def not_modified(self, etag, mtime):
+        """Check If-None-Match / If-Modified-Since against the current file."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+            tags = [t.strip() for t in if_none_match.split(',')]
+            return '*' in tags or etag in tags or f'W/{etag}' in tags
+
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return int(mtime) <= since.timestamp()
+        return False
+
+    def requested_range(self, size, etag, mtime):
+        """Parse a single `Range: bytes=...` header into (start, end), inclusive.
+
+        Returns None to send the whole file (no header, multiple ranges, or a
+        stale If-Range) and 'unsatisfiable' when the range is out of bounds.
+        """
+        header = self.headers.get('Range', '')
+        if not header.startswith('bytes=') or ',' in header:
+            return None
+
+        if_range = self.headers.get('If-Range')
+        if if_range and if_range != etag and if_range != email.utils.formatdate(mtime, usegmt=True):
+            return None
+
+        first, _, last = header[len('bytes='):].strip().partition('-')
+        try:
+            if first:
+                start = int(first)
+                end = int(last) if last else size - 1
+            else:
+                # Suffix range: the last N bytes
+                start = max(size - int(last), 0)
+                end = size - 1
+        except ValueError:
+            return None
+
+        if start >= size or start > end:
+            return 'unsatisfiable'
+        return start, min(end, size - 1)
+
+    def gzipped(self, path, st):
+        """Return gzipped file contents, preferring a fresh precompressed .gz."""
+        precompressed = path + '.gz'
+        try:
+            if os.stat(precompressed).st_mtime_ns >= st.st_mtime_ns:
+                with open(precompressed, 'rb') as f:
+                    return f.read()
+        except FileNotFoundError:
+            pass
+
+        key = (path, st.st_mtime_ns, st.st_size)
+        with self._gzip_lock:
+            body = self._gzip_cache.get(key)
+        if body is None:
+            with open(path, 'rb') as f:
+                body = gzip.compress(f.read(), compresslevel=6)
+            with self._gzip_lock:
+                # Drop stale versions of the same file before caching
+                for stale in [k for k in self._gzip_cache if k[0] == path]:
+                    del self._gzip_cache[stale]
+                self._gzip_cache[key] = body
+        return body
+
+    def with_reload_snippet(self, path):
+        """Return file contents with the live-reload script before </body>."""
+        with open(path, 'rb') as f:
+            body = f.read()
+        end = body.rfind(b'</body>')
+        if end == -1:
+            return body
+        return body[:end] + RELOAD_SNIPPET + body[end:]
+
+    def stream_reload_events(self):
+        """Hold a Server-Sent Events stream open; send 'reload' after each rebuild."""
+        reloader = self.server.reloader
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.close_connection = True
+
+        generation = reloader.generation
+        try:
+            while True:
+                latest = reloader.wait(generation, timeout=15)
+                # A comment line doubles as a keep-alive while nothing changes
+                self.wfile.write(b'data: reload\n\n' if latest != generation else b': ping\n\n')
+                self.wfile.flush()
+                generation = latest
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def copy_range(self, source, remaining):
+        """Copy `remaining` bytes (or everything if None) to the client."""
+        try:
+            while remaining is None or remaining > 0:
+                size = COPY_BUFSIZE if remaining is None else min(COPY_BUFSIZE, remaining)
+                chunk = source.read(size)
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                self._bytes_sent += len(chunk)
+                if remaining is not None:
+                    remaining -= len(chunk)
+        except (BrokenPipeError, ConnectionResetError):
+            # Players routinely abort a download after seeking elsewhere
+            self.close_connection = True
+
+
+class _BytesSource:
+    """Minimal file-like wrapper so in-memory bodies share the copy path."""
+
+    def __init__(self, data):
+        self._data = memoryview(data)
+        self._pos = 0
+
+    def read(self, size):
+        chunk = self._data[self._pos:self._pos + size]
+        self._pos += len(chunk)
+        return chunk
+
+    def close(self):
+        self._data.release()
+
+
+class LiveReload:
+    """Generation counter that SSE streams wait on."""
+
+    def __init__(self):
+        self.generation = 0
+        self._changed = threading.Condition()
+
+    def notify(self):
+        with self._changed:
+            self.generation += 1
+            self._changed.notify_all()
+
+    def wait(self, generation, timeout):
+        """Block until the generation moves past `generation` (or timeout)."""
+        with self._changed:
+            self._changed.wait_for(lambda: self.generation != generation, timeout)
+            return self.generation
+
+
+class Watcher(threading.Thread):
+    """Poll the build inputs and rebuild only the outputs that depend on them."""
+
+    def __init__(self, root, reloader):
+        super().__init__(name='watcher', daemon=True)
+        self.root = Path(root)
+        self.reloader = reloader
+        self.snapshot = self.scan()
+
+    def scan(self):
+        """Map each watched input (relative path) to its (mtime_ns, size)."""
+        paths = [self.root / name for name in DEPENDENCIES]
+        paths += sorted((self.root / 'episodes_markdown').glob('*.md'))
+        snapshot = {}
+        for path in paths:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[path.relative_to(self.root).as_posix()] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def changes(self):
+        current = self.scan()
+        changed = {
+            path for path in current.keys() | self.snapshot.keys()
+            if current.get(path) != self.snapshot.get(path)
+        }
+        self.snapshot = current
+        return changed
+
+    def run(self):
+        pending = set()
+        last_change = 0.0
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            changed = self.changes()
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+            elif pending and time.monotonic() - last_change >= WATCH_DEBOUNCE:
+                try:
+                    self.rebuild(pending)
+                except Exception as e:
+                    print(f"  ❌ Rebuild failed: {e}")
+                pending = set()
+
+    def rebuild(self, changed):
+        started = time.perf_counter()
+        outputs = set()
+
+        for path in sorted(changed):
+            if path.startswith('episodes_markdown/') and not path.endswith('TEMPLATE.md'):
+                outputs |= self.parse_episode(path)
+            else:
+                outputs.update(DEPENDENCIES.get(path, ()))
+        for output in list(outputs):
+            outputs.update(DERIVED_OUTPUTS.get(output, ()))
+
+        catalog = None
+        if outputs & {'feed.xml', 'season2.html'}:
+            # One load shared by both generators
+            from .episodes import load_catalog
+            catalog = load_catalog()
+        if 'feed.xml' in outputs:
+            from .rss import generate_rss
+            try:
+                generate_rss(verbose=False, catalog=catalog)
+            except ValueError as e:
+                # The problems are listed above; the other outputs still rebuild
+                print(f"  ❌ {e}")
+        if 'season2.html' in outputs:
+            from .season2 import generate
+            generate(catalog)
+        if 'feed.html' in outputs:
+            from .feed_html import render_feed_html
+            render_feed_html()
+
+        # Our own write to episode_metadata.json is not a new change
+        self.snapshot.update({
+            path: stamp for path, stamp in self.scan().items() if path == 'episode_metadata.json'
+        })
+
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        rebuilt = ', '.join(sorted(outputs)) or 'nothing to rebuild'
+        print(f"🔄 {', '.join(sorted(changed))} changed → {rebuilt} ({elapsed_ms:.0f}ms)")
+        self.reloader.notify()
+
+    def parse_episode(self, path):
+        """Merge an edited episode into the metadata; return outputs to rebuild."""
+        if not (self.root / path).exists():
+            return set()
+        from . import parse_episode as parser
+
+        try:
+            episode = parser.parse_episode_file(self.root / path)
+        except ValueError as e:
+            print(f"  ⚠ Skipping {path}: {e}")
+            return set()
+        if not parser.update_metadata_file(episode, replace=True):
+            return set()
+        # Only season 2 has a generated season page
+        return {'feed.xml', 'season2.html'} if episode['season'] == 2 else {'feed.xml'}
+
+
+class PreviewServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    reloader = None
+
+
+def main(port=PORT, watch=False):
+    os.chdir(ROOT)
+
+    with PreviewServer(("", port), PreviewRequestHandler) as httpd:
+        if watch:
+            httpd.reloader = LiveReload()
+            Watcher(ROOT, httpd.reloader).start()
+        print(f"🎙️  A Coffee with CompBio - Preview Server")
+        print(f"=" * 50)
+        print(f"Server running at: http://localhost:{port}")
+        print(f"")
+        print(f"📻 Preview RSS feed: http://localhost:{port}/feed.xml")
+        print(f"🌐 Preview website:  http://localhost:{port}/")
+        if watch:
+            print(f"👀 Watching episodes_markdown/ and {', '.join(DEPENDENCIES)}")
+        print(f"")
+        print(f"Press Ctrl+C to stop the server")
+        print(f"=" * 50)
+
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n\nServer stopped.")
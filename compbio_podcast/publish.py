@@ -0,0 +1,406 @@
+"""
+Publish episodes in one command: parse → (transcode, clips) → upload → feed → pages.
+
+The build steps are run as stages of a small DAG inside one process,
+sharing the loaded episode_metadata.json in memory. Each stage declares its
+inputs and outputs; a stage is skipped when the hash of its inputs matches
+the last successful run (recorded in .publish-cache.json) and its outputs
+still exist. Stages whose dependencies are done run concurrently, so the
+feed and season page render while an upload is still in flight.
+
+Until an upload finishes, the feed and pages use the URL the file will have
+on the Internet Archive. If an upload fails, publish exits with an error
+and the episode keeps an empty archive_url; re-run it before deploying.
+
+Usage:
+    python -m compbio_podcast publish [episodes_markdown/S02E03.md ...] [--force] [--no-upload]
+                                      [--profile] [--minify] [--plain-description] [--renditions]
+                                      [--clips]
+    # or:
+    pixi run publish episodes_markdown/S02E03.md
+"""
+
+import copy
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from . import tracing
+from .paths import METADATA_FILE, ROOT
+from .tracing import span
+
+CACHE_FILE = ROOT / ".publish-cache.json"
+
+MAX_WORKERS = 4
+
+
+def file_stamp(path):
+    """Cheap stand-in for hashing large audio files: path, size and mtime."""
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, TypeError):
+        return f"{path}:missing".encode()
+    return f"{path}:{st.st_size}:{st.st_mtime_ns}".encode()
+
+
+class Stage:
+    """One pipeline step.
+
+    `inputs(ctx)` returns the paths and/or bytes the stage reads; `outputs`
+    are the files it writes, relative to the repo root.
+    """
+
+    def __init__(self, name, run, deps=(), inputs=None, outputs=()):
+        self.name = name
+        self.run = run
+        self.deps = tuple(deps)
+        self.inputs = inputs or (lambda ctx: [])
+        self.outputs = tuple(outputs)
+
+    def input_hash(self, ctx):
+        digest = hashlib.sha256()
+        with span("hash", stage=self.name) as s:
+            for item in self.inputs(ctx):
+                if isinstance(item, Path):
+                    digest.update(str(item).encode())
+                    item = item.read_bytes() if item.exists() else b"missing"
+                digest.update(item)
+                digest.update(b"\0")
+                s.add_bytes(len(item))
+        return digest.hexdigest()
+
+
+class PublishContext:
+    """State shared by the stages of one publish run."""
+
+    def __init__(self, metadata, episode_files, upload=True, minify=False, plain_description=False,
+                 renditions=False, clips=False):
+        self.metadata = metadata
+        self.episode_files = episode_files
+        self.upload = upload
+        self.renditions = renditions
+        self.clips = clips
+        self.minify = minify
+        self.plain_description = plain_description
+        self.lock = threading.Lock()
+        # Bumped whenever a stage changes the metadata; keys render_catalog()
+        self.version = 0
+        self._rendered = None
+
+    def pending_uploads(self):
+        """Episodes with a local audio file but no archive_url yet."""
+        with self.lock:
+            return [
+                ep for ep in self.metadata["episodes"]
+                if not ep.get("archive_url") and ep.get("local_file") and Path(ep["local_file"]).exists()
+            ]
+
+    def pending_rendition_uploads(self):
+        """(episode, rendition) pairs whose rendition isn't uploaded yet."""
+        from .renditions import pending_uploads
+
+        with self.lock:
+            return pending_uploads(self.metadata["episodes"])
+
+    def render_metadata(self):
+        """Snapshot of the metadata for the renderers.
+
+        Episodes still waiting for their upload get the archive URL the
+        upload will produce, so rendering doesn't have to wait for it.
+        """
+        from .rss import AUDIO_BASE_URL as base_url
+
+        pending = {id(ep) for ep in self.pending_uploads()} if self.upload else set()
+        with self.lock:
+            snapshot = copy.deepcopy(self.metadata)
+            for original, ep in zip(self.metadata["episodes"], snapshot["episodes"]):
+                if id(original) in pending:
+                    ep["archive_url"] = f"{base_url}/{Path(ep['local_file']).name}"
+        return snapshot
+
+    def render_catalog(self):
+        """render_metadata() as an episodes.Catalog, shared by the renderers.
+
+        The feed and the season page read the same Episode objects, so the
+        derived text fields are built once per metadata version.
+        """
+        from .episodes import Catalog
+
+        version = self.version
+        rendered = self._rendered
+        if rendered is None or rendered[0] != version:
+            rendered = self._rendered = (version, Catalog.from_dict(self.render_metadata()))
+        return rendered[1]
+
+
+# -- stages -------------------------------------------------------------------
+
+def run_parse(ctx):
+    from . import parse_episode as parser
+
+    for md_path in ctx.episode_files:
+        episode = parser.parse_episode_file(md_path)
+        with ctx.lock:
+            action = parser.merge_episode(ctx.metadata, episode, replace=True)
+            if action:
+                ctx.version += 1
+        if action:
+            print(f"  {action} S{episode['season']:02d}E{episode['number']:02d}: {episode['title']}")
+
+
+def run_transcode(ctx):
+    if not ctx.renditions:
+        print("  Renditions disabled (use --renditions)")
+        return
+    from . import renditions
+
+    # Encode from a copy so the renderers never see half-updated episodes
+    with ctx.lock:
+        episodes = copy.deepcopy(ctx.metadata["episodes"])
+    changed = renditions.transcode_episodes(episodes)
+    with ctx.lock:
+        by_file = {ep.get("local_file"): ep for ep in ctx.metadata["episodes"]}
+        for episode in changed:
+            by_file[episode["local_file"]]["renditions"] = episode["renditions"]
+        if changed:
+            ctx.version += 1
+    print(f"  Renditions updated for {len(changed)} episode(s)")
+
+
+def run_clips(ctx):
+    if not ctx.clips:
+        print("  Preview clips disabled (use --clips)")
+        return
+    from . import clips
+
+    with ctx.lock:
+        episodes = copy.deepcopy(ctx.metadata["episodes"])
+    changed = clips.cut_clips(episodes)
+    with ctx.lock:
+        by_file = {ep.get("local_file"): ep for ep in ctx.metadata["episodes"]}
+        for episode in changed:
+            by_file[episode["local_file"]]["clip"] = episode["clip"]
+        if changed:
+            ctx.version += 1
+    print(f"  Clips updated for {len(changed)} episode(s)")
+
+
+def run_upload(ctx):
+    if not ctx.upload:
+        print("  Uploads disabled (--no-upload)")
+        return
+    from . import upload as uploader
+
+    for episode in ctx.pending_uploads():
+        print(f"  Uploading {episode['local_file']}...")
+        archive_url = uploader.upload_audio(episode["local_file"])
+        with ctx.lock:
+            uploader.set_archive_url(ctx.metadata, episode["local_file"], archive_url)
+            ctx.version += 1
+        print(f"  ✓ Uploaded: {archive_url}")
+
+    for episode, rendition in ctx.pending_rendition_uploads():
+        print(f"  Uploading {rendition['file']}...")
+        archive_url = uploader.upload_audio(rendition["file"])
+        with ctx.lock:
+            rendition["archive_url"] = archive_url
+            ctx.version += 1
+        print(f"  ✓ Uploaded: {archive_url}")
+
+
+def run_feed(ctx):
+    from .rss import generate_rss
+
+    generate_rss(verbose=False, catalog=ctx.render_catalog(), minify=ctx.minify,
+                 plain_description=ctx.plain_description)
+
+
+def run_feed_html(ctx):
+    from .feed_html import render_feed_html
+
+    render_feed_html(minify=ctx.minify)
+
+
+def run_pages(ctx):
+    from .season2 import generate
+
+    generate(ctx.render_catalog(), minify=ctx.minify)
+
+
+PACKAGE_DIR = Path(__file__).parent
+
+
+def render_inputs(*modules, files=()):
+    """Inputs of a renderer: its sources, options, the metadata and audio sizes."""
+    def inputs(ctx):
+        metadata = ctx.render_metadata()
+        return [
+            *(PACKAGE_DIR / module for module in modules),
+            *(ROOT / name for name in files),
+            f"minify={ctx.minify} plain={ctx.plain_description}".encode(),
+            json.dumps(metadata, sort_keys=True).encode(),
+            *(file_stamp(ep.get("local_file")) for ep in metadata["episodes"]),
+        ]
+    return inputs
+
+
+def audio_inputs(flag, module):
+    """The audio files (stamps only), plus the stage's flag and module."""
+    def inputs(ctx):
+        with ctx.lock:
+            local_files = [ep.get("local_file") for ep in ctx.metadata["episodes"]]
+        return [
+            str(getattr(ctx, flag)).encode(),
+            PACKAGE_DIR / module,
+            *(file_stamp(path) for path in local_files),
+        ]
+    return inputs
+
+
+STAGES = [
+    Stage("parse", run_parse,
+          inputs=lambda ctx: [Path(p) for p in ctx.episode_files]),
+    Stage("transcode", run_transcode, deps=["parse"],
+          inputs=audio_inputs("renditions", "renditions.py")),
+    Stage("clips", run_clips, deps=["parse", "transcode"],
+          inputs=audio_inputs("clips", "clips.py")),
+    Stage("upload", run_upload, deps=["parse", "transcode"],
+          inputs=lambda ctx: [file_stamp(ep["local_file"]) for ep in ctx.pending_uploads()]
+          + [file_stamp(r["file"]) for _, r in ctx.pending_rendition_uploads()]
+          + [str(ctx.upload).encode()]),
+    Stage("feed", run_feed, deps=["parse", "transcode"],
+          inputs=render_inputs("rss.py", "show_notes.py", "audio_info.py", "minify.py", "validate_feed.py"), outputs=["feed.xml"]),
+    Stage("feed-html", run_feed_html, deps=["feed"],
+          inputs=lambda ctx: [ROOT / "feed.xml", ROOT / "rss.xslt", PACKAGE_DIR / "feed_html.py",
+                              PACKAGE_DIR / "minify.py", str(ctx.minify).encode()],
+          outputs=["feed.html"]),
+    Stage("pages", run_pages, deps=["parse", "clips"],
+          inputs=render_inputs("season2.py", "show_notes.py", "minify.py", "analytics.py", files=["download_stats.json"]),
+          outputs=["season2.html"]),
+]
+
+
+# -- runner -------------------------------------------------------------------
+
+def run_stage(stage, ctx, cache, force):
+    """Run one stage unless its inputs are unchanged. Returns (status, hash)."""
+    digest = stage.input_hash(ctx)
+    outputs_exist = all((ROOT / out).exists() for out in stage.outputs)
+    if not force and cache.get(stage.name) == digest and outputs_exist:
+        return "skipped", digest
+
+    started = time.perf_counter()
+    print(f"▶ {stage.name}")
+    with span(f"stage:{stage.name}", "stage"):
+        stage.run(ctx)
+    print(f"✓ {stage.name} ({(time.perf_counter() - started) * 1000:.0f}ms)")
+    return "done", digest
+
+
+def run_pipeline(stages, ctx, cache, force=False, max_workers=MAX_WORKERS):
+    """Run stages in dependency order, independent ones concurrently.
+
+    Updates `cache` with the input hash of every stage that succeeded.
+    Returns a dict of stage name → "done" / "skipped" / "failed" / "blocked".
+    Raises ValueError if a stage depends on an unknown stage or on itself
+    through a cycle.
+    """
+    names = {stage.name for stage in stages}
+    for stage in stages:
+        unknown = [dep for dep in stage.deps if dep not in names]
+        if unknown:
+            raise ValueError(f"stage {stage.name!r} depends on unknown stage(s): {', '.join(unknown)}")
+
+    status = {}
+    remaining = {stage.name: stage for stage in stages}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while remaining or running:
+            for name, stage in list(remaining.items()):
+                dep_status = [status.get(dep) for dep in stage.deps]
+                if any(s in ("failed", "blocked") for s in dep_status):
+                    status[name] = "blocked"
+                    del remaining[name]
+                elif all(s in ("done", "skipped") for s in dep_status):
+                    running[pool.submit(run_stage, stage, ctx, cache, force)] = name
+                    del remaining[name]
+
+            if not running:
+                if remaining:
+                    raise ValueError(f"dependency cycle between stages: {', '.join(remaining)}")
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    status[name], cache[name] = future.result()
+                except Exception as e:
+                    status[name] = "failed"
+                    cache.pop(name, None)
+                    print(f"✗ {name} failed: {e}")
+
+    return status
+
+
+def load_json(path, default):
+    if not path.exists():
+        return default
+    with span("load", path=path.name) as s:
+        raw = path.read_bytes()
+        s.add_bytes(len(raw))
+        return json.loads(raw)
+
+
+def save_metadata(metadata):
+    """Write episode_metadata.json if the in-memory copy changed."""
+    text = json.dumps(metadata, indent=2, ensure_ascii=False)
+    if METADATA_FILE.read_text(encoding="utf-8") != text:
+        with span("write", path=METADATA_FILE.name) as s:
+            data = text.encode("utf-8")
+            METADATA_FILE.write_bytes(data)
+            s.add_bytes(len(data))
+        print(f"✓ Saved {METADATA_FILE.name}")
+
+
+def main(episodes, force=False, upload=True, jobs=None, profile=False,
+         trace_file="publish-trace.json", minify=False, plain_description=False, renditions=False,
+         clips=False):
+    if profile:
+        tracing.enable()
+
+    for md_path in episodes:
+        if not Path(md_path).exists():
+            print(f"Error: File not found: {md_path}")
+            sys.exit(1)
+
+    episode_files = [Path(p).resolve() for p in episodes]
+    ctx = PublishContext(load_json(METADATA_FILE, None), episode_files, upload=upload,
+                         minify=minify, plain_description=plain_description, renditions=renditions,
+                         clips=clips)
+    cache = load_json(CACHE_FILE, {})
+
+    started = time.perf_counter()
+    try:
+        status = run_pipeline(STAGES, ctx, cache, force=force, max_workers=jobs or MAX_WORKERS)
+    finally:
+        # Keep whatever finished (e.g. parsed episodes) even if a stage failed
+        save_metadata(ctx.metadata)
+        CACHE_FILE.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+
+    print()
+    print(f"Publish finished in {time.perf_counter() - started:.2f}s")
+    for name, result in status.items():
+        print(f"  {name:<10} {result}")
+    if profile:
+        tracing.write_trace(trace_file)
+        print()
+        tracing.print_summary()
+        print(f"\nTrace written to {trace_file} (open in https://ui.perfetto.dev)")
+    if any(result in ("failed", "blocked") for result in status.values()):
+        sys.exit(1)
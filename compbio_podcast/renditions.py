@@ -0,0 +1,190 @@
+"""
+Low-bitrate renditions of the episode audio for listeners on mobile data.
+
+Each episode with a local audio file gets an Opus and an AAC rendition,
+loudness-normalised to -16 LUFS (the usual podcast target). ffmpeg does the
+encoding, one process per rendition, several at a time. Output files are
+named after the SHA-256 of their source, so an unchanged episode is never
+re-encoded, and a replaced audio file gets fresh renditions (with an empty
+archive_url, so they are uploaded again).
+
+The renditions are recorded on the episode in episode_metadata.json:
+
+    "renditions": [{"name": "opus", "title": "Opus 32 kbps", "file": "renditions/....32k.opus",
+                    "type": "audio/opus", "codecs": "opus", "bitrate": 32000,
+                    "length": 7340032, "source_sha256": "...", "archive_url": ""}]
+
+publish uploads them next to the original, and generate-rss lists them as
+podcast:alternateEnclosure entries.
+
+Usage:
+    python -m compbio_podcast transcode [--jobs 4]
+    # or, as part of a publish:
+    python -m compbio_podcast publish --renditions
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from .paths import METADATA_FILE, ROOT
+from .tracing import span
+
+RENDITIONS_DIR = Path("renditions")
+
+MAX_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+HASH_CHUNK = 1024 * 1024
+
+LOUDNORM = "loudnorm=I=-16:TP=-1.5:LRA=11"
+
+RENDITIONS = {
+    "opus": {
+        "title": "Opus 32 kbps", "ext": ".opus", "type": "audio/opus", "codecs": "opus", "bitrate": 32000,
+        "args": ["-c:a", "libopus", "-b:a", "32k", "-application", "voip"],
+    },
+    "aac": {
+        "title": "AAC 48 kbps", "ext": ".m4a", "type": "audio/mp4", "codecs": "mp4a.40.2", "bitrate": 48000,
+        "args": ["-c:a", "aac", "-b:a", "48k", "-movflags", "+faststart"],
+    },
+}
+
+
+def source_hash(path):
+    """SHA-256 of an audio file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with span("hash", path=str(path)) as s, open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            digest.update(chunk)
+            s.add_bytes(len(chunk))
+    return digest.hexdigest()
+
+
+def rendition_path(source, digest, name):
+    spec = RENDITIONS[name]
+    return RENDITIONS_DIR / f"{Path(source).stem}.{digest[:12]}.{spec['bitrate'] // 1000}k{spec['ext']}"
+
+
+def ffmpeg_command(source, output, name):
+    return [
+        "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+        "-i", str(source), "-vn", "-ac", "1", "-af", LOUDNORM,
+        *RENDITIONS[name]["args"],
+        "-f", "ogg" if name == "opus" else "mp4",
+        str(output),
+    ]
+
+
+def run_ffmpeg(command, output):
+    """Run `command(path)`, an ffmpeg command line writing to `path`.
+
+    ffmpeg writes next to `output`, which only appears once it succeeded.
+    """
+    import subprocess
+
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    partial = output.with_name(output.name + ".part")
+    with span("ffmpeg", path=str(output)) as s:
+        result = subprocess.run(command(partial), capture_output=True, text=True)
+        if result.returncode != 0:
+            partial.unlink(missing_ok=True)
+            raise RuntimeError(f"ffmpeg failed for {output.name}: {result.stderr.strip()}")
+        partial.replace(output)
+        s.add_bytes(output.stat().st_size)
+    return output
+
+
+def transcode(source, output, name):
+    """Encode one rendition."""
+    return run_ffmpeg(lambda path: ffmpeg_command(source, path, name), output)
+
+
+def rendition_entry(output, name, digest, previous=None):
+    spec = RENDITIONS[name]
+    archive_url = ""
+    if previous and previous.get("source_sha256") == digest:
+        archive_url = previous.get("archive_url", "")
+    return {
+        "name": name,
+        "title": spec["title"],
+        "file": str(output),
+        "type": spec["type"],
+        "codecs": spec["codecs"],
+        "bitrate": spec["bitrate"],
+        "length": output.stat().st_size,
+        "source_sha256": digest,
+        "archive_url": archive_url,
+    }
+
+
+def transcode_episodes(episodes, max_workers=MAX_WORKERS):
+    """Make sure every episode with local audio has all renditions.
+
+    Updates each episode dict's "renditions" in place and returns the
+    episodes that changed. Raises RuntimeError if ffmpeg is missing or fails.
+    """
+    jobs = []       # (episode, name, output, digest)
+    for episode in episodes:
+        source = episode.get("local_file")
+        if not source or not Path(source).exists():
+            continue
+        digest = source_hash(source)
+        for name in RENDITIONS:
+            jobs.append((episode, name, rendition_path(source, digest, name), digest))
+
+    to_encode = [job for job in jobs if not job[2].exists()]
+    if to_encode and shutil.which("ffmpeg") is None:
+        raise RuntimeError("ffmpeg not found. Install it with: pixi add ffmpeg (or your package manager)")
+
+    # Imported here: concurrent.futures loads logging, which the other
+    # commands importing this module never need
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(transcode, ep["local_file"], output, name): output
+                   for ep, name, output, _ in to_encode}
+        for future in as_completed(futures):
+            future.result()
+            print(f"  ✓ Encoded {futures[future]}")
+
+    changed = []
+    for episode in {id(ep): ep for ep, *_ in jobs}.values():
+        previous = {r["name"]: r for r in episode.get("renditions", [])}
+        renditions = [
+            rendition_entry(output, name, digest, previous.get(name))
+            for ep, name, output, digest in jobs if ep is episode
+        ]
+        if renditions != episode.get("renditions"):
+            episode["renditions"] = renditions
+            changed.append(episode)
+    return changed
+
+
+def pending_uploads(episodes):
+    """(episode, rendition) pairs whose file exists locally but isn't uploaded."""
+    return [
+        (episode, rendition)
+        for episode in episodes
+        for rendition in episode.get("renditions", [])
+        if not rendition.get("archive_url") and Path(rendition["file"]).exists()
+    ]
+
+
+def main(jobs=None):
+    with open(METADATA_FILE, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    try:
+        changed = transcode_episodes(data["episodes"], max_workers=jobs or MAX_WORKERS)
+    except RuntimeError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if changed:
+        with open(METADATA_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"✓ Renditions up to date for {len(data['episodes'])} episode(s), {len(changed)} updated")
+    print(f"  Files in {ROOT / RENDITIONS_DIR}; run publish to upload them and update the feed")
@@ -0,0 +1,285 @@
+"""
+Generate a new RSS feed for the podcast matching the Ausha format.
+Uses placeholder URLs for Internet Archive audio hosting.
+
+Usage:
+    python -m compbio_podcast generate-rss
+"""
+
+import html
+import os
+from pathlib import Path
+from datetime import datetime
+
+from .audio_info import format_duration, mime_type_for, probe_cached, save_cache
+from .episodes import load_catalog, strip_ausha_footer
+from .paths import METADATA_FILE
+from .tracing import span
+
+# Configuration - Update these with your actual values
+#
+# IMPORTANT: USE_RELATIVE_URLS should normally be True
+# - True: Uses relative URLs (podcast-artwork.jpeg) - works for local testing AND Netlify
+# - False: Uses absolute URLs - only needed if submitting to some podcast directories
+#
+# Relative URLs work perfectly fine on Netlify and in most podcast apps!
+USE_RELATIVE_URLS = False
+
+# Production URLs (update these after deploying to Netlify)
+PODCAST_LINK = "https://podcast.boston-wib.org"
+FEED_URL = "https://podcast.boston-wib.org/feed.xml"
+ARTWORK_URL_ABSOLUTE = "https://podcast.boston-wib.org/podcast-artwork-2026.jpg"
+AUDIO_BASE_URL = "https://archive.org/download/acoffeewithcompbio"
+
+# Relative URLs for local testing and Netlify deployment
+ARTWORK_URL_RELATIVE = "podcast-artwork-2026.jpg"
+
+# Choose which artwork URL to use
+ARTWORK_URL = ARTWORK_URL_RELATIVE if USE_RELATIVE_URLS else ARTWORK_URL_ABSOLUTE
+
+def create_rss_header():
+    """Create the RSS XML header."""
+    return '''<?xml version="1.0" encoding="UTF-8"?>
+<?xml-stylesheet type="text/xsl" href="rss.xslt" ?>
+<rss
+    xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
+    xmlns:googleplay="http://www.google.com/schemas/play-podcasts/1.0"
+    xmlns:content="http://purl.org/rss/1.0/modules/content/"
+    xmlns:atom="http://www.w3.org/2005/Atom"
+    xmlns:spotify="http://www.spotify.com/ns/rss"
+    xmlns:podcast="https://podcastindex.org/namespace/1.0"
+    version="2.0">
+'''
+
+def create_channel_header(catalog):
+    """Create the channel metadata section."""
+    description = strip_ausha_footer(catalog.podcast_description)
+    now = datetime.utcnow().strftime('%a, %d %b %Y %H:%M:%S +0000')
+
+    return f'''    <channel>
+        <title>A Coffee with CompBio</title>
+        <link>{PODCAST_LINK}</link>
+        <atom:link rel="self" type="application/rss+xml" href="{FEED_URL}"/>
+        <description>{description}</description>
+        <language>en</language>
+        <copyright>Lorena Pantano</copyright>
+        <lastBuildDate>{now}</lastBuildDate>
+        <pubDate>{now}</pubDate>
+        <generator>Self-hosted podcast feed</generator>
+        <spotify:countryOfOrigin>us</spotify:countryOfOrigin>
+
+        <itunes:author>Lorena Pantano</itunes:author>
+        <itunes:owner>
+            <itunes:name>Lorena Pantano</itunes:name>
+            <itunes:email>lorena.pantano@gmail.com</itunes:email>
+        </itunes:owner>
+        <itunes:summary>{description}</itunes:summary>
+        <itunes:explicit>false</itunes:explicit>
+        <itunes:block>no</itunes:block>
+        <podcast:block>no</podcast:block>
+        <itunes:type>episodic</itunes:type>
+
+        <googleplay:author>Lorena Pantano</googleplay:author>
+        <googleplay:email>lorena.pantano@gmail.com</googleplay:email>
+        <googleplay:description>{description}</googleplay:description>
+        <googleplay:explicit>false</googleplay:explicit>
+
+        <category>Science</category>
+        <itunes:category text="Science">
+            <itunes:category text="Life Sciences"/>
+        </itunes:category>
+        <category>Business</category>
+        <itunes:category text="Business">
+            <itunes:category text="Careers"/>
+        </itunes:category>
+
+        <image>
+            <url>{ARTWORK_URL}</url>
+            <title>A Coffee with CompBio</title>
+            <link>{PODCAST_LINK}</link>
+        </image>
+        <itunes:image href="{ARTWORK_URL}"/>
+        <googleplay:image href="{ARTWORK_URL}"/>
+
+'''
+
+def create_alternate_enclosure(audio_type, length, url, bitrate=None, codecs=None, title=None, default=False):
+    """Podcasting 2.0 <podcast:alternateEnclosure> for one version of the audio."""
+    attributes = f'type="{audio_type}" length="{length}"'
+    if bitrate:
+        attributes += f' bitrate="{bitrate}"'
+    if codecs:
+        attributes += f' codecs="{html.escape(codecs)}"'
+    if title:
+        attributes += f' title="{html.escape(title)}"'
+    if default:
+        attributes += ' default="true"'
+    return f'''
+            <podcast:alternateEnclosure {attributes}>
+                <podcast:source uri="{html.escape(url)}"/>
+            </podcast:alternateEnclosure>'''
+
+def create_episode_item(episode, plain_description=False):
+    """Create an episode item in the RSS feed from an episodes.Episode.
+
+    With `plain_description`, <description> holds the plain-text version and
+    <content:encoded> is only added when the HTML says more than that.
+    """
+    title = episode.title
+    description = episode.feed_description
+    episode_num = episode.number
+    season_num = episode.season or 1
+
+    # File size of the local audio, else the size recorded in the metadata
+    local_file = Path(episode.local_file or '')
+    with span("stat", path=str(local_file)):
+        try:
+            file_size = local_file.stat().st_size if local_file.name else episode.length
+            local_exists = bool(local_file.name)
+        except OSError:
+            file_size, local_exists = episode.length, False
+
+    # Use Internet Archive URL if available, otherwise construct placeholder
+    if episode.archive_url:
+        audio_url = episode.archive_url
+    else:
+        audio_filename = local_file.name if local_exists else f"episode_{episode_num:02d}.mp3"
+        audio_url = f"{AUDIO_BASE_URL}/{audio_filename}"
+
+    # Duration and type from the audio headers when the file is here
+    duration = episode.duration
+    audio_type = mime_type_for(local_file.name if local_exists else audio_url)
+    bitrate = None
+    if local_exists:
+        try:
+            info = probe_cached(local_file, save=False)
+            duration, audio_type, bitrate = format_duration(info.duration), info.mime_type, info.bitrate
+        except ValueError as e:
+            print(f"Warning: could not read {local_file}: {e}")
+
+    # Low-bitrate renditions, listed next to the original (the default)
+    alternates = ""
+    if episode.renditions:
+        alternates = create_alternate_enclosure(audio_type, file_size, audio_url, bitrate, default=True)
+        for rendition in episode.renditions:
+            url = rendition.get('archive_url') or f"{AUDIO_BASE_URL}/{Path(rendition['file']).name}"
+            alternates += create_alternate_enclosure(
+                rendition['type'], rendition['length'], url, rendition['bitrate'], rendition['codecs'],
+                rendition.get('title'),
+            )
+
+    description_xml = f"<![CDATA[{description}]]>"
+    content_encoded = f"\n            <content:encoded>{description_xml}</content:encoded>"
+    if plain_description:
+        plain = episode.plain_text
+        # No tags in the HTML: the plain text already says all of it
+        if plain == " ".join(description.split()):
+            content_encoded = ""
+        description_xml = html.escape(html.unescape(plain), quote=False)
+
+    item = f'''        <item>
+            <title>{title}</title>
+            <guid isPermaLink="false">{episode.guid}</guid>
+            <description>{description_xml}</description>{content_encoded}
+            <pubDate>{episode.published}</pubDate>
+            <enclosure url="{audio_url}" length="{file_size}" type="{audio_type}"/>{alternates}
+            <link>{PODCAST_LINK}</link>
+
+            <itunes:author>Lorena Pantano</itunes:author>
+            <itunes:explicit>false</itunes:explicit>
+            <itunes:keywords>life science,data science,bioinformatics,computational biology</itunes:keywords>
+            <itunes:duration>{duration}</itunes:duration>
+            <itunes:episodeType>full</itunes:episodeType>
+            <itunes:season>{season_num}</itunes:season>
+            <podcast:season>{season_num}</podcast:season>
+            <itunes:episode>{episode_num}</itunes:episode>
+            <podcast:episode>{episode_num}</podcast:episode>
+            <itunes:subtitle>{episode.subtitle}</itunes:subtitle>
+
+            <googleplay:author>Lorena Pantano</googleplay:author>
+            <googleplay:explicit>false</googleplay:explicit>
+
+            <itunes:image href="{ARTWORK_URL}"/>
+            <googleplay:image href="{ARTWORK_URL}"/>
+        </item>
+'''
+    return item
+
+def generate_rss(verbose=True, catalog=None, minify=False, plain_description=False, validate=True):
+    """Generate RSS feed from metadata.
+
+    `catalog` is the loaded episodes.Catalog; episode_metadata.json is
+    loaded from disk when not given. `minify` strips the indentation;
+    `plain_description` is passed on to create_episode_item().
+
+    The feed is written to feed.xml.part and checked with
+    validate_feed.validate() before it replaces feed.xml; raises ValueError
+    if it has problems (feed.xml is left as it was, the .part file is kept
+    to inspect).
+    """
+
+    # Load metadata
+    if catalog is None:
+        if not METADATA_FILE.exists():
+            print("Error: episode_metadata.json not found!")
+            return
+        try:
+            catalog = load_catalog()
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
+
+    with span("render", output="feed.xml") as s:
+        # Start building the RSS feed
+        parts = [create_rss_header(), create_channel_header(catalog)]
+
+        # Add episodes (reverse order so newest first). Joined once at the
+        # end: appending each item to a growing string copies the whole
+        # feed over and over on large catalogs
+        episodes = catalog.episodes
+        parts += [create_episode_item(episode, plain_description) for episode in episodes]
+        save_cache()
+
+        # Close tags
+        parts.append('''    </channel>
+</rss>''')
+        rss_content = "".join(parts)
+        s.add_bytes(len(rss_content))
+
+    if minify:
+        from .minify import minify as minify_text
+        rss_content = minify_text('feed.xml', rss_content, 'xml')
+
+    # Write to file
+    output_file = Path('feed.xml')
+    part_file = output_file.with_name(output_file.name + '.part')
+    with span("write", path=str(output_file)) as s, open(part_file, 'w', encoding='utf-8') as f:
+        f.write(rss_content)
+        s.add_bytes(f.tell())
+
+    if validate:
+        from .validate_feed import validate as validate_feed
+        violations = validate_feed(part_file)
+        if violations:
+            for violation in violations:
+                print(f"  ✗ {violation}")
+            raise ValueError(f"{output_file} failed validation with {len(violations)} problem(s); "
+                             f"kept the previous one (new feed in {part_file})")
+    os.replace(part_file, output_file)
+
+    print(f"✓ RSS feed generated: {output_file.absolute()}")
+    print(f"  Episodes included: {len(episodes)}")
+    if not verbose:
+        return
+    print()
+    print("Placeholder URLs used:")
+    print(f"  - Podcast link: {PODCAST_LINK}")
+    print(f"  - Feed URL: {FEED_URL}")
+    print(f"  - Artwork: {ARTWORK_URL}")
+    print(f"  - Audio base: {AUDIO_BASE_URL}")
+    print()
+    print("Next steps:")
+    print("1. Upload audio files to Internet Archive")
+    print("2. Update URLs in compbio_podcast/rss.py with your actual Netlify URL")
+    print("3. Re-run this script after deploying to Netlify")
+    print("4. Commit feed.xml and deploy via Netlify")
@@ -1,4 +1,3 @@
-#!/usr/bin/env python3
 """
 Generate season2.html from episode_metadata.json.
 
@@ -6,76 +5,54 @@ Reads all season 2 episodes and produces a static HTML archive page
 matching the style of season1.html.
 
 Usage:
-    python generate_season2_html.py
+    python -m compbio_podcast generate-season2
     # or:
     pixi run generate-season2
 """
 
-import json
-import re
-from datetime import datetime
-from pathlib import Path
+from .analytics import episode_downloads, load_summary
+from .episodes import load_catalog
+from .paths import ROOT
+from .tracing import span
 
-METADATA_FILE = Path(__file__).parent / "episode_metadata.json"
-OUTPUT_FILE = Path(__file__).parent / "season2.html"
+OUTPUT_FILE = ROOT / "season2.html"
 
 
-def format_date(rfc2822):
-    """Convert 'Mon, 27 Jan 2026 12:00:00 +0000' → 'Jan 27, 2026'."""
-    try:
-        dt = datetime.strptime(rfc2822.strip(), "%a, %d %b %Y %H:%M:%S %z")
-        return dt.strftime("%b %d, %Y")
-    except ValueError:
-        return rfc2822
-
-
-def html_to_plain_summary(html, max_chars=200):
-    """Strip HTML tags and truncate to a short summary."""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    if len(text) > max_chars:
-        text = text[:max_chars].rsplit(" ", 1)[0] + "…"
-    return text
-
-
-def build_episode_block(ep, is_newest):
+def build_episode_block(ep, is_newest, downloads=None):
     new_badge = '<span class="new-badge">NEW</span>' if is_newest else ""
-    date_str = format_date(ep["published"])
-    duration = ep["duration"]
-    title = ep["title"]
-    number = ep["number"]
-    archive_url = ep.get("archive_url", "")
-    summary = html_to_plain_summary(ep["description"])
+    downloads_str = f" | Downloads: {downloads:,}" if downloads else ""
+
+    player = ""
+    if ep.clip:
+        player = f"""
+                    <div class="preview-player">
+                        <span>Preview:</span>
+                        <audio controls preload="none" src="{ep.clip['file']}"></audio>
+                    </div>"""
 
     listen_btn = ""
-    if archive_url:
-        listen_btn = f'\n                    <a href="{archive_url}" class="listen-link">&#127911; Listen</a>'
+    if ep.archive_url:
+        listen_btn = f'\n                    <a href="{ep.archive_url}" class="listen-link">&#127911; Listen</a>'
 
     return f"""
                 <div class="episode">
-                    <h3>Episode {number}: {title} {new_badge}</h3>
-                    <div class="episode-meta">Published: {date_str} | Duration: {duration}</div>
+                    <h3>Episode {ep.number}: {ep.title} {new_badge}</h3>
+                    <div class="episode-meta">Published: {ep.display_date} | Duration: {ep.duration}{downloads_str}</div>
                     <div class="episode-description">
-                        <p>{summary}</p>
-                    </div>{listen_btn}
+                        <p>{ep.summary}</p>
+                    </div>{player}{listen_btn}
                 </div>"""
 
 
-def generate():
-    with open(METADATA_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    season2 = [ep for ep in data["episodes"] if ep.get("season") == 2]
-    # Sort by episode number ascending for display (newest at top already from JSON ordering)
-    season2_sorted = sorted(season2, key=lambda e: e["number"])
+def render_page(season2_sorted, downloads=None):
+    """Render the full season2.html page for the given episodes.
 
-    if not season2_sorted:
-        print("No season 2 episodes found in episode_metadata.json")
-        return
-
-    newest_number = max(ep["number"] for ep in season2_sorted)
+    `downloads` maps (season, number) → download count (see analytics.py).
+    """
+    downloads = downloads or {}
+    newest_number = max(ep.number for ep in season2_sorted)
     episode_blocks = "".join(
-        build_episode_block(ep, ep["number"] == newest_number)
+        build_episode_block(ep, ep.number == newest_number, downloads.get((ep.season, ep.number)))
         for ep in reversed(season2_sorted)  # newest first on the page
     )
 
@@ -213,6 +190,21 @@ def generate():
             transform: translateY(-2px);
         }}
 
+        .preview-player {{
+            display: flex;
+            align-items: center;
+            gap: 10px;
+            margin-top: 10px;
+            font-size: 0.9em;
+            color: #666;
+        }}
+
+        .preview-player audio {{
+            height: 36px;
+            flex: 1;
+            max-width: 400px;
+        }}
+
         .footer {{
             text-align: center;
             padding: 20px;
@@ -253,11 +245,37 @@ def generate():
 </html>
 """
 
-    OUTPUT_FILE.write_text(html, encoding="utf-8")
-    print(f"Generated {OUTPUT_FILE} with {len(season2_sorted)} episode(s):")
-    for ep in reversed(season2_sorted):
-        print(f"  S02E{ep['number']:02d}: {ep['title']}")
+    return html
+
+
+def generate(catalog=None, minify=False):
+    """Write season2.html; `catalog` is the episodes.Catalog (loaded if None)."""
+    if catalog is None:
+        try:
+            catalog = load_catalog()
+        except ValueError as e:
+            print(f"Error: {e}")
+            return
 
+    # Sort by episode number ascending for display (newest at top already from JSON ordering)
+    season2_sorted = sorted(catalog.season(2), key=lambda e: e.number)
 
-if __name__ == "__main__":
-    generate()
+    if not season2_sorted:
+        print("No season 2 episodes found in episode_metadata.json")
+        return
+
+    with span("render", output=OUTPUT_FILE.name) as s:
+        html = render_page(season2_sorted, episode_downloads(load_summary()))
+        s.add_bytes(len(html.encode("utf-8")))
+    if minify:
+        from .minify import minify as minify_text
+        html = minify_text(OUTPUT_FILE.name, html, "html")
+
+    with span("write", path=str(OUTPUT_FILE)) as s:
+        # write_text() returns characters; the trace counts bytes
+        data = html.encode("utf-8")
+        OUTPUT_FILE.write_bytes(data)
+        s.add_bytes(len(data))
+    print(f"Generated {OUTPUT_FILE} with {len(season2_sorted)} episode(s):")
+    for ep in reversed(season2_sorted):
+        print(f"  S02E{ep.number:02d}: {ep.title}")
@@ -0,0 +1,142 @@
+"""
+Show notes: episode markdown → HTML.
+
+Episodes parsed from markdown keep their source in episode_metadata.json
+rather than the rendered HTML:
+
+    "description_md": "In this episode ...",
+    "links_md": "- [NCBI Codeathons](https://...)",
+    "footer": "footer-5d1b0c2e",
+
+The footer, which is the same for most episodes, is stored once under the
+top-level "blocks" key and referenced by name. The HTML is rendered when a
+generator first asks for it (Episode.description_html); renders are
+memoized by source, so the shared footer is converted once per process and
+an unchanged episode is not re-rendered when the catalog is reloaded (watch
+mode, publish).
+
+Episodes imported from Ausha only have HTML and keep it in "description".
+"""
+
+import hashlib
+import re
+from functools import lru_cache
+
+# Rendered descriptions kept across catalog reloads
+RENDER_CACHE_SIZE = 1024
+
+
+LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+
+
+def md_inline_to_html(text):
+    """Convert inline markdown (bold, links) to HTML."""
+    # [text](url) → <a href="url">text</a>
+    if "](" in text:
+        text = LINK_RE.sub(lambda m: f'<a href="{m[2]}">{m[1]}</a>', text)
+    # **text** → <b>text</b>
+    if "**" in text:
+        text = BOLD_RE.sub(lambda m: f"<b>{m[1]}</b>", text)
+    return text
+
+
+def md_block_to_html(text):
+    """Convert a markdown block (paragraphs, lists) to HTML."""
+    html_parts = []
+    lines = text.splitlines()
+    i = 0
+
+    while i < len(lines):
+        line = lines[i]
+
+        # Blank line → paragraph separator
+        if not line.strip():
+            if html_parts and html_parts[-1] != "<p><br /></p>":
+                html_parts.append("<p><br /></p>")
+            i += 1
+            continue
+
+        # Bullet list block
+        if line.strip().startswith("- "):
+            list_items = []
+            while i < len(lines) and lines[i].strip().startswith("- "):
+                item = lines[i].strip()[2:]
+                list_items.append(f"<li>{md_inline_to_html(item)}</li>")
+                i += 1
+            html_parts.append("<ul>" + "".join(list_items) + "</ul>")
+            continue
+
+        # Regular paragraph line — collect consecutive non-blank, non-list lines
+        para_lines = []
+        while i < len(lines) and lines[i].strip() and not lines[i].strip().startswith("- "):
+            para_lines.append(lines[i].strip())
+            i += 1
+        para_text = " ".join(para_lines)
+        html_parts.append(f"<p>{md_inline_to_html(para_text)}</p>")
+
+    return "".join(html_parts)
+
+
+def links_to_html(links_text):
+    """The Links section: a heading plus the bullet list ("" if empty)."""
+    if not links_text.strip():
+        return ""
+    html = "<p><br /></p><p><b>Links:</b></p>"
+    list_items = []
+    for line in links_text.splitlines():
+        line = line.strip()
+        if line.startswith("- "):
+            item = line[2:]
+            list_items.append(f"<li>{md_inline_to_html(item)}</li>")
+    if list_items:
+        html += "<ul>" + "".join(list_items) + "</ul>"
+    return html
+
+
+@lru_cache(maxsize=None)
+def render_block(text):
+    """md_block_to_html() for shared blocks, converted once per process."""
+    return md_block_to_html(text)
+
+
+def build_description(description_text, links_text, footer_text):
+    """Combine Description, Links, and Footer sections into one HTML string."""
+    html = md_block_to_html(description_text) + links_to_html(links_text)
+    if footer_text.strip():
+        html += "<p><br /></p>" + render_block(footer_text)
+    return html
+
+
+render_description = lru_cache(maxsize=RENDER_CACHE_SIZE)(build_description)
+
+
+def block_key(text, kind="footer"):
+    """Name of a shared block: its kind plus a hash of the text."""
+    return f"{kind}-{hashlib.sha1(text.encode()).hexdigest()[:8]}"
+
+
+def store_footer(data, episode):
+    """Move an episode's "footer_md" text into data["blocks"].
+
+    The episode keeps only the block's name under "footer"; an identical
+    footer already in the file is reused.
+    """
+    footer = episode.pop("footer_md", None)
+    if footer is None:
+        return
+    if not footer.strip():
+        episode["footer"] = ""
+        return
+    key = block_key(footer)
+    data.setdefault("blocks", {})[key] = footer
+    episode["footer"] = key
+
+
+def description_html(episode, blocks):
+    """HTML description of a raw metadata dict, rendered from its source if it has one."""
+    if "description_md" not in episode:
+        return episode.get("description", "")
+    footer = episode.get("footer")
+    return render_description(episode["description_md"], episode.get("links_md", ""),
+                              blocks[footer] if footer else "")
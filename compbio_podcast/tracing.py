@@ -0,0 +1,163 @@
+"""
+Lightweight timing, byte and memory instrumentation for the build scripts.
+
+Wrap a unit of work in a span:
+
+    from .tracing import span
+
+    with span("write", path="feed.xml") as s:
+        output_file.write_text(rss_content, encoding="utf-8")
+        s.add_bytes(len(rss_content))
+
+Tracing is off unless enable() is called (`publish --profile` does this),
+so an unprofiled run pays one attribute check per span. When enabled, each
+span records wall time, bytes moved and peak memory above its start
+(tracemalloc, process-wide, so spans on other threads count too), and
+write_trace() saves everything in the Chrome trace event format, which
+https://ui.perfetto.dev and chrome://tracing can open.
+"""
+
+import json
+import os
+import threading
+import time
+
+
+class _Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.origin = time.perf_counter()
+
+
+_tracer = _Tracer()
+
+
+class Span:
+    __slots__ = ("name", "category", "args", "bytes", "start", "start_memory", "peak_seen")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.bytes = 0
+
+    def add_bytes(self, count):
+        self.bytes += count
+
+    def __enter__(self):
+        import tracemalloc
+
+        stack = _stack()
+        current, peak = tracemalloc.get_traced_memory()
+        if stack:
+            # reset_peak() below would hide the parent's peak so far
+            stack[-1].peak_seen = max(stack[-1].peak_seen, peak)
+        tracemalloc.reset_peak()
+        self.start_memory = current
+        self.peak_seen = current
+        stack.append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        import tracemalloc
+
+        end = time.perf_counter()
+        peak = max(self.peak_seen, tracemalloc.get_traced_memory()[1])
+        stack = _stack()
+        stack.pop()
+        if stack:
+            stack[-1].peak_seen = max(stack[-1].peak_seen, peak)
+
+        args = dict(self.args, bytes=self.bytes, peak_memory=peak - self.start_memory)
+        if exc_type is not None:
+            args["error"] = repr(exc)
+        event = {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": (self.start - _tracer.origin) * 1e6,
+            "dur": (end - self.start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        }
+        with _tracer.lock:
+            _tracer.events.append(event)
+        return False
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def add_bytes(self, count):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+def _stack():
+    stack = getattr(_tracer.local, "stack", None)
+    if stack is None:
+        stack = _tracer.local.stack = []
+    return stack
+
+
+def enable():
+    """Start recording spans (and tracing memory allocations)."""
+    # Imported here: it pulls in pickle and linecache, which unprofiled
+    # runs never need
+    import tracemalloc
+
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _tracer.origin = time.perf_counter()
+    _tracer.events = []
+    _tracer.enabled = True
+
+
+def span(name, category=None, **args):
+    """Context manager timing one unit of work; `args` end up in the trace."""
+    if not _tracer.enabled:
+        return _NOOP
+    return Span(name, category or name, args)
+
+
+def write_trace(path):
+    """Save the recorded spans as a Chrome trace event JSON file."""
+    with _tracer.lock:
+        events = list(_tracer.events)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def summary():
+    """Aggregate spans by name: [(name, count, total_ms, bytes, peak_memory)]."""
+    totals = {}
+    with _tracer.lock:
+        events = list(_tracer.events)
+    for event in events:
+        count, total, moved, peak = totals.get(event["name"], (0, 0.0, 0, 0))
+        totals[event["name"]] = (
+            count + 1,
+            total + event["dur"] / 1000,
+            moved + event["args"]["bytes"],
+            max(peak, event["args"]["peak_memory"]),
+        )
+    return sorted(((name, *values) for name, values in totals.items()), key=lambda row: -row[2])
+
+
+def print_summary():
+    print(f"{'span':<18} {'count':>6} {'total ms':>10} {'bytes':>12} {'peak mem':>10}")
+    for name, count, total_ms, moved, peak in summary():
+        print(f"{name:<18} {count:>6} {total_ms:>10.1f} {moved:>12,} {peak / 1024:>8.0f}KB")
@@ -1,19 +1,68 @@
-#!/usr/bin/env python3
 """
 Upload a single audio file to Internet Archive and update episode_metadata.json
+
+Usage:
+    python -m compbio_podcast upload-single audio/Season_2_Episode_3.mp3
 """
 import json
 import sys
 from pathlib import Path
-from internetarchive import get_item
+
+from .paths import METADATA_FILE
+from .tracing import span
+
+# Configuration
+ARCHIVE_IDENTIFIER = "acoffeewithcompbio"
+
+def archive_url_for(audio_file):
+    """Download URL an audio file will have once uploaded."""
+    return f"https://archive.org/download/{ARCHIVE_IDENTIFIER}/{Path(audio_file).name}"
+
+def upload_audio(audio_file):
+    """Upload one audio file to the Internet Archive item; return its URL."""
+    from internetarchive import get_item
+
+    audio_file = Path(audio_file)
+
+    # Get the Internet Archive item
+    item = get_item(ARCHIVE_IDENTIFIER)
+
+    # Prepare metadata for the file
+    file_metadata = {
+        'collection': ARCHIVE_IDENTIFIER,
+        'mediatype': 'audio',
+    }
+
+    # Upload the file
+    with span("upload", path=str(audio_file)) as s:
+        item.upload(
+            str(audio_file),
+            metadata=file_metadata,
+            verbose=True
+        )
+        s.add_bytes(audio_file.stat().st_size)
+    return archive_url_for(audio_file)
+
+def set_archive_url(metadata, local_file, archive_url):
+    """Record archive_url on the episode whose local_file matches.
+
+    Returns the updated episode, or None if no episode matched.
+    """
+    name = Path(local_file).name
+    # Find the episode with matching local_file
+    for episode in metadata['episodes']:
+        episode_file = episode.get('local_file') or ''
+        if episode_file == local_file or episode_file.endswith(name):
+            episode['archive_url'] = archive_url
+            # Enclosure length for feeds built without the audio
+            if Path(local_file).exists():
+                episode['length'] = Path(local_file).stat().st_size
+            return episode
+    return None
 
 def upload_single_file(audio_file_path):
     """Upload a single audio file to Internet Archive"""
     
-    # Configuration
-    ARCHIVE_IDENTIFIER = "acoffeewithcompbio"
-    METADATA_FILE = Path("episode_metadata.json")
-    
     audio_file = Path(audio_file_path)
     
     if not audio_file.exists():
@@ -34,25 +83,10 @@ def upload_single_file(audio_file_path):
     print(f"Uploading file: {audio_file.name}")
     print(f"To collection: {ARCHIVE_IDENTIFIER}")
     
-    # Get the Internet Archive item
-    item = get_item(ARCHIVE_IDENTIFIER)
-    
-    # Prepare metadata for the file
-    file_metadata = {
-        'collection': ARCHIVE_IDENTIFIER,
-        'mediatype': 'audio',
-    }
-    
     # Upload the file
     try:
         print(f" uploading {audio_file.name}...")
-        result = item.upload(
-            str(audio_file),
-            metadata=file_metadata,
-            verbose=True
-        )
-        
-        archive_url = f"https://archive.org/download/{ARCHIVE_IDENTIFIER}/{audio_file.name}"
+        archive_url = upload_audio(audio_file)
         print(f"  ✓ Uploaded: {archive_url}")
         
         # Update episode_metadata.json with the archive_url
@@ -60,16 +94,9 @@ def upload_single_file(audio_file_path):
             with open(METADATA_FILE, 'r', encoding='utf-8') as f:
                 metadata = json.load(f)
             
-            # Find the episode with matching local_file
-            updated = False
-            for episode in metadata['episodes']:
-                if episode['local_file'] == local_file or episode['local_file'].endswith(audio_file.name):
-                    episode['archive_url'] = archive_url
-                    updated = True
-                    print(f"  ✓ Updated metadata for: {episode['title']}")
-                    break
-            
-            if updated:
+            episode = set_archive_url(metadata, local_file, archive_url)
+            if episode:
+                print(f"  ✓ Updated metadata for: {episode['title']}")
                 with open(METADATA_FILE, 'w', encoding='utf-8') as f:
                     json.dump(metadata, f, indent=2, ensure_ascii=False)
                 print(f"  ✓ Saved updated metadata to {METADATA_FILE}")
@@ -81,13 +108,3 @@ def upload_single_file(audio_file_path):
     except Exception as e:
         print(f"  ❌ Upload failed: {e}")
         return False
-
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python upload_single_file.py <audio_file_path>")
-        print("Example: python upload_single_file.py audio/episode_01_202601_12-New-Year-Resolutions-For-Computational-Biologists.m4a")
-        sys.exit(1)
-    
-    audio_file = sys.argv[1]
-    success = upload_single_file(audio_file)
-    sys.exit(0 if success else 1)
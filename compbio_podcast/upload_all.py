@@ -1,19 +1,17 @@
-#!/usr/bin/env python3
 """
 Upload podcast audio files to Internet Archive.
 Requires: internetarchive package (pip install internetarchive)
 Configure: ia configure (to set up credentials)
+
+Usage:
+    python -m compbio_podcast upload-all
 """
 
 import json
 import sys
 from pathlib import Path
-try:
-    from internetarchive import get_item, upload
-except ImportError:
-    print("Error: internetarchive package not installed")
-    print("Install with: pip install internetarchive")
-    sys.exit(1)
+
+from .show_notes import description_html
 
 # Internet Archive identifier for your podcast
 # This should be unique and URL-friendly
@@ -21,6 +19,7 @@ ARCHIVE_IDENTIFIER = "acoffeewithcompbio"
 
 def upload_to_archive():
     """Upload all audio files to Internet Archive."""
+    from internetarchive import get_item
 
     # Load metadata
     metadata_file = Path("episode_metadata.json")
@@ -71,7 +70,7 @@ def upload_to_archive():
         # Prepare file metadata
         file_metadata = {
             'title': f"{episode['number']:02d} - {episode['title']}",
-            'description': episode.get('description', ''),
+            'description': description_html(episode, metadata.get('blocks', {})),
             'date': episode.get('published', ''),
             'track': str(episode['number'])
         }
@@ -88,6 +87,7 @@ def upload_to_archive():
             archive_url = f"https://archive.org/download/{ARCHIVE_IDENTIFIER}/{local_file.name}"
             uploaded_urls[episode['number']] = archive_url
             episode['archive_url'] = archive_url
+            episode['length'] = local_file.stat().st_size
 
             print(f"  ✓ Uploaded: {archive_url}\n")
 
@@ -106,7 +106,7 @@ def upload_to_archive():
 
     return uploaded_urls
 
-if __name__ == "__main__":
+def main():
     # Check if user is logged in to Internet Archive
     print("Note: You need to configure Internet Archive credentials first.")
     print("Run: ia configure")
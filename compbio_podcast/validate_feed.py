@@ -0,0 +1,113 @@
+"""
+Check feed.xml before it is deployed.
+
+The feed is read with a streaming iterparse; each <item> is checked and then
+dropped, so memory stays flat however many episodes there are. Every
+violation found in the pass is reported, not just the first:
+
+- the file must be well-formed XML (a raw "&" in a title breaks every client)
+- each item needs an <enclosure> with a positive integer length
+- each item needs a non-empty <guid>, unique within the feed
+- <pubDate> must be an RFC 2822 date
+- <itunes:duration> must be seconds, MM:SS or H:MM:SS
+
+generate-rss runs this on the new feed before it replaces feed.xml, and
+fails on violations.
+
+Usage:
+    python -m compbio_podcast validate-feed [feed.xml]
+"""
+
+import re
+import sys
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from xml.etree.ElementTree import ParseError, iterparse
+
+from .tracing import span
+
+ITUNES = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+
+DURATION_RE = re.compile(r"\d+|(?:\d+:)?[0-5]?\d:[0-5]\d")
+
+
+def check_item(item, guids):
+    """Violations for one <item> element; records its guid in `guids`."""
+    problems = []
+
+    enclosure = item.find("enclosure")
+    if enclosure is None:
+        problems.append("missing <enclosure>")
+    else:
+        length = enclosure.get("length", "")
+        if not length.isdigit() or int(length) == 0:
+            problems.append(f"enclosure length must be a positive integer, got {length!r}")
+
+    guid = (item.findtext("guid") or "").strip()
+    if not guid:
+        problems.append("missing <guid>")
+    elif guid in guids:
+        problems.append(f"duplicate guid {guid} (also {guids[guid]})")
+
+    pub_date = (item.findtext("pubDate") or "").strip()
+    try:
+        parsedate_to_datetime(pub_date)
+    except (TypeError, ValueError):
+        problems.append(f"unparseable pubDate {pub_date!r}")
+
+    duration = (item.findtext(f"{ITUNES}duration") or "").strip()
+    if not DURATION_RE.fullmatch(duration):
+        problems.append(f"invalid itunes:duration {duration!r}")
+
+    return guid, problems
+
+
+def validate(path="feed.xml"):
+    """All violations in the feed at `path`, as 'where: what' strings."""
+    path = Path(path)
+    violations = []
+    guids = {}      # guid → label of the item that had it first
+    items = 0
+    with span("validate", path=str(path)) as s:
+        s.add_bytes(path.stat().st_size)
+        channel = None
+        try:
+            for event, elem in iterparse(path, events=("start", "end")):
+                if event == "start":
+                    if elem.tag == "channel":
+                        channel = elem
+                    continue
+                if elem.tag != "item":
+                    continue
+                items += 1
+                label = f"item {items}"
+                title = elem.findtext("title")
+                if title:
+                    label += f" ({title.strip()[:60]})"
+                guid, problems = check_item(elem, guids)
+                violations += [f"{label}: {problem}" for problem in problems]
+                guids.setdefault(guid, label)
+                # Done with this item: drop it so the tree never grows
+                elem.clear()
+                if channel is not None:
+                    channel.remove(elem)
+        except ParseError as e:
+            line, column = e.position
+            violations.append(f"{path.name}: not well-formed XML at line {line}, column {column + 1}")
+    if not items and not violations:
+        violations.append(f"{path.name}: no <item> elements")
+    return violations
+
+
+def main(path=None):
+    path = path or "feed.xml"
+    if not Path(path).exists():
+        print(f"Error: {path} not found")
+        sys.exit(1)
+    violations = validate(path)
+    if violations:
+        print(f"✗ {path}: {len(violations)} problem(s)")
+        for violation in violations:
+            print(f"  {violation}")
+        sys.exit(1)
+    print(f"✓ {path} is valid")
@@ -0,0 +1,9 @@
+import sys
+from pathlib import Path
+
+# Let a bare `pytest` (not only `python -m pytest`) import compbio_podcast
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: spawns many interpreters; deselect with -m 'not slow'")
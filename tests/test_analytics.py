@@ -0,0 +1,43 @@
+import gzip
+import json
+
+from compbio_podcast import analytics
+
+AGENT = "AppleCoreMedia/1.0.0.21A329 (iPhone; U; CPU OS 17_0 like Mac OS X)"
+
+
+def log_line(day, sent=2_000_000, ip="203.0.113.7"):
+    return (f'{ip} - - [{day}/Oct/2026:08:00:00 +0000] "GET /Season_2_Episode_2.mp3 HTTP/1.1" '
+            f'206 {sent} "-" "{AGENT}"\n')
+
+
+def test_logs_given_newest_first_are_deduplicated_per_day(tmp_path):
+    # access.log holds 05-06/Oct; the rotated log holds five range requests on 04/Oct
+    newest = tmp_path / "access.log"
+    newest.write_text(log_line("05") + log_line("06"))
+    rotated = tmp_path / "access.log.1.gz"
+    with gzip.open(rotated, "wt") as f:
+        f.writelines(log_line("04") for _ in range(5))
+
+    output = tmp_path / "download_stats.json"
+    analytics.main([newest, rotated], output=output)
+
+    summary = json.loads(output.read_text())
+    assert summary["downloads"] == 3
+    assert summary["daily"] == {"2026-10-04": 1, "2026-10-05": 1, "2026-10-06": 1}
+
+
+def test_requests_older_than_the_window_are_skipped():
+    counter = analytics.DownloadCounter()
+    for day in ("05", "06", "04", "04"):
+        counter.add_line(log_line(day))
+    assert sum(counter.downloads.values()) == 2
+    assert counter.skipped == 2
+
+
+def test_listener_sketches_are_only_kept_for_catalog_files():
+    counter = analytics.DownloadCounter(files={"Season_2_Episode_2.mp3"})
+    counter.add_line(log_line("05"))
+    counter.add_line(log_line("05").replace("Season_2_Episode_2", "wp-admin-probe"))
+    assert list(counter.episode_listeners) == ["Season_2_Episode_2.mp3"]
+    assert counter.matched == 2
@@ -0,0 +1,94 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from compbio_podcast import download
+
+BODY = bytes(range(256)) * 40
+
+
+class AudioHandler(BaseHTTPRequestHandler):
+    """Serves BODY with Range support; /truncated stops half way."""
+
+    def do_GET(self):
+        self.server.ranges.append(self.headers.get("Range"))
+        start = 0
+        if self.headers.get("Range"):
+            start = int(self.headers["Range"].removeprefix("bytes=").rstrip("-"))
+            if start >= len(BODY):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(BODY)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(BODY) - 1}/{len(BODY)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY) - start))
+        self.end_headers()
+        if self.path == "/truncated":
+            self.wfile.write(BODY[start:start + 1000])
+            self.close_connection = True
+        else:
+            self.wfile.write(BODY[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), AudioHandler)
+    httpd.ranges = []
+    threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def url(server, path="/episode.mp3"):
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+def test_partial_download_resumes_with_a_range_request(server, tmp_path):
+    target = tmp_path / "episode.mp3"
+    (tmp_path / "episode.mp3.part").write_bytes(BODY[:4000])
+
+    filepath, fetched = download.download_audio_file(requests.Session(), url(server), target)
+
+    assert fetched and filepath.read_bytes() == BODY
+    assert server.ranges == ["bytes=4000-"]
+    assert not (tmp_path / "episode.mp3.part").exists()
+
+
+def test_416_for_a_complete_part_file_renames_it(server, tmp_path):
+    target = tmp_path / "episode.mp3"
+    (tmp_path / "episode.mp3.part").write_bytes(BODY)
+
+    download.download_audio_file(requests.Session(), url(server), target)
+
+    assert target.read_bytes() == BODY
+    assert server.ranges == [f"bytes={len(BODY)}-"]
+
+
+def test_part_file_larger_than_the_remote_file_is_restarted(server, tmp_path):
+    target = tmp_path / "episode.mp3"
+    (tmp_path / "episode.mp3.part").write_bytes(BODY + b"stale")
+
+    download.download_audio_file(requests.Session(), url(server), target)
+
+    assert target.read_bytes() == BODY
+    assert server.ranges == [f"bytes={len(BODY) + 5}-", None]
+
+
+def test_truncated_body_is_caught_by_the_content_length_check(server, tmp_path):
+    target = tmp_path / "episode.mp3"
+
+    with pytest.raises(IOError, match="incomplete download"):
+        download.download_audio_file(requests.Session(), url(server, "/truncated"), target)
+
+    assert not target.exists()
+    assert (tmp_path / "episode.mp3.part").read_bytes() == BODY[:1000]
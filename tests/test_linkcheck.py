@@ -0,0 +1,91 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from compbio_podcast import linkcheck
+
+# path → (HEAD status, GET status); None drops the connection unanswered
+ROUTES = {
+    "/ok": (200, 200),
+    "/no-head": (405, 200),
+    "/drops-head": (None, 200),
+    "/gone": (404, 404),
+    "/rate-limited": (429, 429),
+    "/linkedin": (999, 999),
+}
+
+
+class LinkHandler(BaseHTTPRequestHandler):
+    def respond(self, method):
+        self.server.requests.append((method, self.path))
+        status = ROUTES[self.path][method == "GET"]
+        if status is None:
+            self.close_connection = True
+            return
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self):
+        self.respond("HEAD")
+
+    def do_GET(self):
+        self.respond("GET")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), LinkHandler)
+    httpd.requests = []
+    threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(linkcheck, "CACHE_FILE", tmp_path / ".linkcheck-cache.json")
+
+
+def url(server, path):
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+def test_falls_back_to_get_when_head_is_refused_or_dropped(server):
+    results, _ = linkcheck.check_links([url(server, "/no-head"), url(server, "/drops-head"),
+                                        url(server, "/gone")])
+
+    states = {u.rpartition("/")[2]: r["state"] for u, r in results.items()}
+    assert states == {"no-head": "ok", "drops-head": "ok", "gone": "broken"}
+    assert ("GET", "/no-head") in server.requests
+    assert ("GET", "/drops-head") in server.requests
+
+
+def test_rate_limited_and_999_are_blocked_not_broken(server):
+    results, _ = linkcheck.check_links([url(server, "/rate-limited"), url(server, "/linkedin")])
+
+    assert [r["state"] for r in results.values()] == ["blocked", "blocked"]
+
+
+def test_fresh_results_come_from_the_cache(server):
+    urls = [url(server, "/ok"), url(server, "/gone")]
+    linkcheck.check_links(urls)
+    server.requests.clear()
+
+    results, checked = linkcheck.check_links(urls)
+    assert checked == 0 and not server.requests
+    assert results[urls[0]]["state"] == "ok"
+
+    # An hour later only the failure is stale
+    later = time.time() + linkcheck.FAILURE_TTL + 1
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(linkcheck.time, "time", lambda: later)
+        _, checked = linkcheck.check_links(urls)
+    assert checked == 1
+    assert {path for _, path in server.requests} == {"/gone"}
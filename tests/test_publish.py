@@ -0,0 +1,23 @@
+import pytest
+
+from compbio_podcast.publish import Stage, run_pipeline
+
+
+def test_stages_run_after_their_dependencies():
+    order = []
+    stages = [Stage("b", lambda ctx: order.append("b"), deps=["a"]),
+              Stage("a", lambda ctx: order.append("a"))]
+    assert run_pipeline(stages, None, {}) == {"a": "done", "b": "done"}
+    assert order == ["a", "b"]
+
+
+def test_unknown_dependency_is_an_error():
+    stages = [Stage("feed", lambda ctx: None, deps=["pasre"])]
+    with pytest.raises(ValueError, match="'feed' depends on unknown stage.*pasre"):
+        run_pipeline(stages, None, {})
+
+
+def test_dependency_cycle_is_an_error():
+    stages = [Stage("a", lambda ctx: None, deps=["b"]), Stage("b", lambda ctx: None, deps=["a"])]
+    with pytest.raises(ValueError, match="cycle"):
+        run_pipeline(stages, None, {})
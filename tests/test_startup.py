@@ -0,0 +1,13 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+STARTUP = Path(__file__).resolve().parent.parent / "benchmarks" / "startup.py"
+
+
+@pytest.mark.slow
+def test_cli_modules_import_fast_without_heavy_dependencies():
+    result = subprocess.run([sys.executable, str(STARTUP)], capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr